@@ -0,0 +1,17 @@
+-- Migration: Replace the full is_active index with a partial index
+-- A full index on the skewed is_active boolean is rarely used by the
+-- planner but still costs write amplification on every insert/update.
+-- The partial index matches the shape of the active-deals-per-category
+-- query exactly. Also drop idx_deals_external_id, which duplicates the
+-- index created by the UNIQUE constraint on external_id.
+
+-- Drop the redundant indexes
+DROP INDEX IF EXISTS idx_deals_active;
+DROP INDEX IF EXISTS idx_deals_external_id;
+
+-- Create the partial index used by get_active_deals_by_category
+CREATE INDEX IF NOT EXISTS idx_deals_active_by_cat
+    ON deals(category_id) WHERE is_active = true;
+
+-- Verify the change
+\d deals
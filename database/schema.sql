@@ -32,9 +32,8 @@ CREATE TABLE IF NOT EXISTS deals (
 );
 
 -- Indexes for deals table
-CREATE INDEX IF NOT EXISTS idx_deals_external_id ON deals(external_id);
 CREATE INDEX IF NOT EXISTS idx_deals_category ON deals(category_id);
-CREATE INDEX IF NOT EXISTS idx_deals_active ON deals(is_active);
+CREATE INDEX IF NOT EXISTS idx_deals_active_by_cat ON deals(category_id) WHERE is_active = true;
 CREATE INDEX IF NOT EXISTS idx_deals_extra_data ON deals USING gin(extra_data);
 CREATE INDEX IF NOT EXISTS idx_deals_first_seen ON deals(first_seen_at);
 
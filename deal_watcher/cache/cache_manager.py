@@ -1,8 +1,11 @@
 """File system cache manager for storing scraped listings."""
 
+import hashlib
 import json
 import os
+import queue
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -10,27 +13,131 @@ from urllib.parse import urlparse
 
 from deal_watcher.utils.logger import get_logger
 
+# orjson serializes datetime objects natively in C (no pre-pass over the dict
+# tree needed) and is 3-10x faster than stdlib json; fall back gracefully.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack + zstd give ~5x faster encoding and ~3-4x smaller cache files than
+# pretty-printed JSON; when either is missing we stay on the JSON format.
+try:
+    import msgpack
+    import zstandard
+except ImportError:
+    msgpack = None
+    zstandard = None
+
 logger = get_logger(__name__)
 
+# For Bazos: /inzerat/123456789/title or /123456789.htm
+# Compiled once as a single alternation so extraction is one scan per URL
+_LISTING_ID_RE = re.compile(r'/inzerat/(\d+)/|/(\d+)\.htm|/(\d+)$')
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+) if orjson is not None else 0
+
+# Preferred on-disk format: zstd-compressed msgpack ('.msz'); legacy '.json'
+# files remain readable so existing caches keep working
+_CACHE_SUFFIX = '.msz' if msgpack is not None else '.json'
+_CACHE_SUFFIXES = ('.msz', '.json')
+
+if zstandard is not None:
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+
+def _serialize_cache(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize data to cache-file bytes.
+
+    Prefers zstd-compressed msgpack, then orjson (native datetime support,
+    C-level speed), then stdlib json with datetime pre-conversion.
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        Encoded bytes in the format matching _CACHE_SUFFIX
+    """
+    if msgpack is not None:
+        packed = msgpack.packb(data, datetime=True, default=str)
+        return _ZSTD_COMPRESSOR.compress(packed)
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        data, indent=2, ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+def _read_cache_file(filepath) -> Dict[str, Any]:
+    """
+    Deserialize a cache file, dispatching on its extension.
+
+    Args:
+        filepath: File path to read ('.msz' or legacy '.json')
+
+    Returns:
+        Deserialized data
+    """
+    filepath = Path(filepath)
+    if filepath.suffix == '.msz':
+        raw = _ZSTD_DECOMPRESSOR.decompress(filepath.read_bytes())
+        return msgpack.unpackb(raw, timestamp=3)
+    if orjson is not None:
+        return orjson.loads(filepath.read_bytes())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 
-def _convert_datetimes_to_str(data: Any) -> Any:
+def _content_digest(data: Dict[str, Any]) -> str:
     """
-    Recursively convert datetime objects to ISO format strings for JSON serialization.
+    Compute a short stable digest of listing data.
+
+    Keys are serialized in canonical (sorted) order so the digest only
+    changes when the content does.
 
     Args:
-        data: Data to convert (can be dict, list, datetime, or any other type)
+        data: Listing data dictionary
 
     Returns:
-        Data with datetime objects converted to strings
+        Hex digest string
     """
-    if isinstance(data, datetime):
-        return data.isoformat()
-    elif isinstance(data, dict):
-        return {key: _convert_datetimes_to_str(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        return [_convert_datetimes_to_str(item) for item in data]
+    if orjson is not None:
+        buf = orjson.dumps(
+            data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+        )
     else:
-        return data
+        buf = json.dumps(
+            data, sort_keys=True, ensure_ascii=False, default=_json_default
+        ).encode('utf-8')
+    return hashlib.blake2b(buf, digest_size=16).hexdigest()
+
+
+def _json_default(obj: Any) -> str:
+    """
+    Fallback serializer for types stdlib json does not handle natively.
+
+    Passed as json.dumps(default=...), so the C encoder only calls back
+    into Python for the rare datetime node instead of us pre-walking the
+    whole dict tree.
+
+    Args:
+        obj: Object the encoder could not serialize
+
+    Returns:
+        String representation (ISO format for datetimes)
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+# Sentinel telling the background writer thread to shut down
+_WRITER_STOP = object()
 
 
 class CacheManager:
@@ -45,11 +152,60 @@ class CacheManager:
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Directories already created this process - avoids repeated mkdir/stat
+        # syscalls on the hot path when processing thousands of listings
+        self._ensured_dirs: set = set()
+        # Per-listing-dir snapshot counts keyed by mtime, so repeated
+        # get_cache_stats calls only re-scan directories that changed
+        self._stats_cache: Dict[str, tuple] = {}
+        # Background writer: save_listing enqueues serialized bytes and
+        # returns immediately, so the scraping loop is not blocked on
+        # open/write/close syscall latency per listing
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._pending_writes = 0
+        self._pending_cond = threading.Condition()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name='cache-writer', daemon=True
+        )
+        self._writer_thread.start()
         logger.info(f"Cache manager initialized at {self.cache_dir.absolute()}")
 
+    def _writer_loop(self):
+        """Consume queued (filepath, payload) tuples and write them to disk."""
+        while True:
+            item = self._write_queue.get()
+            if item is _WRITER_STOP:
+                break
+            filepath, payload = item
+            try:
+                fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+                logger.debug(f"Wrote cache file {filepath}")
+            except Exception as e:
+                logger.error(f"Error writing cache file {filepath}: {e}")
+            finally:
+                with self._pending_cond:
+                    self._pending_writes -= 1
+                    self._pending_cond.notify_all()
+
+    def flush(self):
+        """Block until all queued cache writes have hit the filesystem."""
+        with self._pending_cond:
+            while self._pending_writes > 0:
+                self._pending_cond.wait()
+
+    def close(self):
+        """Flush pending writes and stop the background writer thread."""
+        self.flush()
+        self._write_queue.put(_WRITER_STOP)
+        self._writer_thread.join()
+
     def _get_listing_dir(self, source: str, category: str, listing_id: str) -> Path:
         """
-        Get directory path for a listing.
+        Get directory path for a listing, creating it if needed.
 
         Args:
             source: Source website (e.g., 'bazos')
@@ -60,9 +216,27 @@ class CacheManager:
             Path to listing directory
         """
         listing_dir = self.cache_dir / source / category / listing_id
-        listing_dir.mkdir(parents=True, exist_ok=True)
+        if listing_dir not in self._ensured_dirs:
+            listing_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(listing_dir)
         return listing_dir
 
+    def _get_listing_dir_readonly(self, source: str, category: str, listing_id: str) -> Path:
+        """
+        Get directory path for a listing without creating it.
+
+        Used by read paths, which should never create directories.
+
+        Args:
+            source: Source website (e.g., 'bazos')
+            category: Category (e.g., 'auto', 'reality')
+            listing_id: External listing ID
+
+        Returns:
+            Path to listing directory (may not exist)
+        """
+        return self.cache_dir / source / category / listing_id
+
     def _generate_filename(self, timestamp: Optional[datetime] = None) -> str:
         """
         Generate filename with timestamp.
@@ -71,11 +245,11 @@ class CacheManager:
             timestamp: Timestamp to use (default: now)
 
         Returns:
-            Filename in format: YYYY-MM-DD_HHMMSS.json
+            Filename in format: YYYY-MM-DD_HHMMSS plus the cache suffix
         """
         if timestamp is None:
             timestamp = datetime.now()
-        return timestamp.strftime("%Y-%m-%d_%H%M%S.json")
+        return timestamp.strftime('%Y-%m-%d_%H%M%S') + _CACHE_SUFFIX
 
     def _extract_listing_id_from_url(self, url: str) -> Optional[str]:
         """
@@ -87,17 +261,9 @@ class CacheManager:
         Returns:
             Listing ID or None
         """
-        # For Bazos: /inzerat/123456789/title or /123456789.htm
-        patterns = [
-            r'/inzerat/(\d+)/',
-            r'/(\d+)\.htm',
-            r'/(\d+)$'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _LISTING_ID_RE.search(url)
+        if match:
+            return next(group for group in match.groups() if group)
 
         logger.warning(f"Could not extract listing ID from URL: {url}")
         return None
@@ -137,28 +303,36 @@ class CacheManager:
         filename = self._generate_filename(timestamp)
         filepath = listing_dir / filename
 
-        # Convert datetime objects to strings for JSON serialization
-        serializable_data = _convert_datetimes_to_str(listing_data)
-
-        # Add metadata
+        # Add metadata (datetime values inside listing_data are handled
+        # by _serialize_cache: msgpack/orjson natively, stdlib json via
+        # pre-conversion)
         cache_data = {
             'cached_at': (timestamp or datetime.now()).isoformat(),
             'source': source,
             'category': category,
             'listing_id': listing_id,
-            'data': serializable_data
+            'data': listing_data
         }
 
-        # Save to file
+        # Serialize here, hand the actual write to the background thread
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved listing {listing_id} to {filepath}")
-            return filepath
+            payload = _serialize_cache(cache_data)
         except Exception as e:
-            logger.error(f"Error saving listing to cache: {e}")
+            logger.error(f"Error serializing listing for cache: {e}")
             return None
 
+        # Sidecar digest lets detect_changes skip reading and parsing the
+        # snapshot when the listing content is unchanged (the common case)
+        digest_path = filepath.with_suffix('.b2')
+        digest = _content_digest(listing_data).encode('ascii')
+
+        with self._pending_cond:
+            self._pending_writes += 2
+        self._write_queue.put((filepath, payload))
+        self._write_queue.put((digest_path, digest))
+        logger.debug(f"Queued listing {listing_id} for {filepath}")
+        return filepath
+
     def get_latest_listing(
         self,
         source: str,
@@ -176,23 +350,28 @@ class CacheManager:
         Returns:
             Cached listing data or None if not found
         """
-        listing_dir = self._get_listing_dir(source, category, listing_id)
+        # Make sure queued writes for this listing are visible
+        self.flush()
+        listing_dir = self._get_listing_dir_readonly(source, category, listing_id)
 
         if not listing_dir.exists():
             return None
 
-        # Get all cache files, sorted by name (which sorts by timestamp)
-        cache_files = sorted(listing_dir.glob("*.json"), reverse=True)
+        # Single pass over the directory - filenames sort by timestamp, so the
+        # max name is the newest snapshot (no sort, no list materialization)
+        with os.scandir(listing_dir) as it:
+            latest = max(
+                (entry for entry in it if entry.name.endswith(_CACHE_SUFFIXES)),
+                key=lambda entry: entry.name,
+                default=None
+            )
 
-        if not cache_files:
+        if latest is None:
             return None
 
-        # Read the latest file
-        latest_file = cache_files[0]
         try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            logger.debug(f"Retrieved cached listing {listing_id} from {latest_file}")
+            cache_data = _read_cache_file(latest.path)
+            logger.debug(f"Retrieved cached listing {listing_id} from {latest.path}")
             return cache_data
         except Exception as e:
             logger.error(f"Error reading cached listing: {e}")
@@ -215,20 +394,23 @@ class CacheManager:
         Returns:
             List of cached versions, newest first
         """
-        listing_dir = self._get_listing_dir(source, category, listing_id)
+        self.flush()
+        listing_dir = self._get_listing_dir_readonly(source, category, listing_id)
 
         if not listing_dir.exists():
             return []
 
         # Get all cache files, sorted by name (newest first)
-        cache_files = sorted(listing_dir.glob("*.json"), reverse=True)
+        with os.scandir(listing_dir) as it:
+            cache_files = sorted(
+                (entry.path for entry in it if entry.name.endswith(_CACHE_SUFFIXES)),
+                reverse=True
+            )
 
         history = []
         for cache_file in cache_files:
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                history.append(cache_data)
+                history.append(_read_cache_file(cache_file))
             except Exception as e:
                 logger.error(f"Error reading cache file {cache_file}: {e}")
 
@@ -246,8 +428,12 @@ class CacheManager:
         Returns:
             True if cached, False otherwise
         """
-        listing_dir = self._get_listing_dir(source, category, listing_id)
-        return listing_dir.exists() and any(listing_dir.glob("*.json"))
+        self.flush()
+        listing_dir = self._get_listing_dir_readonly(source, category, listing_id)
+        if not listing_dir.exists():
+            return False
+        with os.scandir(listing_dir) as it:
+            return any(entry.name.endswith(_CACHE_SUFFIXES) for entry in it)
 
     def detect_changes(
         self,
@@ -268,6 +454,25 @@ class CacheManager:
         Returns:
             Dictionary with 'changed' (bool) and 'differences' (dict) keys
         """
+        # Fast path: compare content digests before reading the snapshot.
+        # Equal digests mean identical content - no parse needed.
+        self.flush()
+        listing_dir = self._get_listing_dir_readonly(source, category, listing_id)
+        if listing_dir.exists():
+            with os.scandir(listing_dir) as it:
+                latest_name = max(
+                    (e.name for e in it if e.name.endswith(_CACHE_SUFFIXES)),
+                    default=None
+                )
+            if latest_name:
+                digest_file = listing_dir / (latest_name.rsplit('.', 1)[0] + '.b2')
+                try:
+                    old_digest = digest_file.read_text(encoding='ascii')
+                except OSError:
+                    old_digest = None
+                if old_digest is not None and old_digest == _content_digest(new_data):
+                    return {'changed': False, 'differences': {}}
+
         latest = self.get_latest_listing(source, category, listing_id)
 
         if not latest:
@@ -319,9 +524,10 @@ class CacheManager:
         if not category_dir.exists():
             return []
 
-        # Get all subdirectories (each is a listing ID)
-        listing_ids = [d.name for d in category_dir.iterdir() if d.is_dir()]
-        return listing_ids
+        # Get all subdirectories (each is a listing ID); scandir exposes the
+        # file type from the directory read itself, avoiding a stat per entry
+        with os.scandir(category_dir) as it:
+            return [e.name for e in it if e.is_dir(follow_symlinks=False)]
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -341,41 +547,58 @@ class CacheManager:
         if not self.cache_dir.exists():
             return stats
 
-        for source_dir in self.cache_dir.iterdir():
-            if not source_dir.is_dir():
-                continue
-
-            stats['total_sources'] += 1
-            source_name = source_dir.name
-            stats['sources'][source_name] = {
-                'categories': {},
-                'total_listings': 0
-            }
-
-            for category_dir in source_dir.iterdir():
-                if not category_dir.is_dir():
+        with os.scandir(self.cache_dir) as sources:
+            for source_dir in sources:
+                if not source_dir.is_dir(follow_symlinks=False):
                     continue
 
-                stats['total_categories'] += 1
-                category_name = category_dir.name
-
-                listing_count = 0
-                file_count = 0
-
-                for listing_dir in category_dir.iterdir():
-                    if not listing_dir.is_dir():
-                        continue
-
-                    listing_count += 1
-                    files = list(listing_dir.glob("*.json"))
-                    file_count += len(files)
-
-                stats['sources'][source_name]['categories'][category_name] = {
-                    'listings': listing_count,
-                    'files': file_count
+                stats['total_sources'] += 1
+                source_name = source_dir.name
+                stats['sources'][source_name] = {
+                    'categories': {},
+                    'total_listings': 0
                 }
-                stats['sources'][source_name]['total_listings'] += listing_count
-                stats['total_listings'] += listing_count
-                stats['total_files'] += file_count
+
+                with os.scandir(source_dir.path) as categories:
+                    for category_dir in categories:
+                        if not category_dir.is_dir(follow_symlinks=False):
+                            continue
+
+                        stats['total_categories'] += 1
+                        category_name = category_dir.name
+
+                        listing_count = 0
+                        file_count = 0
+
+                        with os.scandir(category_dir.path) as listings:
+                            for listing_dir in listings:
+                                if not listing_dir.is_dir(follow_symlinks=False):
+                                    continue
+
+                                listing_count += 1
+
+                                # DirEntry.stat is served from the scandir
+                                # result, so the mtime check is free; only
+                                # re-count files when the dir changed
+                                mtime_ns = listing_dir.stat(follow_symlinks=False).st_mtime_ns
+                                cached = self._stats_cache.get(listing_dir.path)
+                                if cached is not None and cached[0] == mtime_ns:
+                                    file_count += cached[1]
+                                    continue
+
+                                with os.scandir(listing_dir.path) as files:
+                                    dir_files = sum(
+                                        1 for e in files if e.name.endswith(_CACHE_SUFFIXES)
+                                    )
+                                self._stats_cache[listing_dir.path] = (mtime_ns, dir_files)
+                                file_count += dir_files
+
+                        stats['sources'][source_name]['categories'][category_name] = {
+                            'listings': listing_count,
+                            'files': file_count
+                        }
+                        stats['sources'][source_name]['total_listings'] += listing_count
+                        stats['total_listings'] += listing_count
+                        stats['total_files'] += file_count
 
         return stats
@@ -3,7 +3,7 @@
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Text, DECIMAL, Boolean,
-    TIMESTAMP, ForeignKey, Index, UniqueConstraint
+    TIMESTAMP, ForeignKey, Index, UniqueConstraint, text
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
@@ -59,10 +59,15 @@ class Deal(Base):
     images = relationship("DealImage", back_populates="deal", cascade="all, delete-orphan")
 
     # Indexes
+    # Note: external_id already gets an index from unique=True, and a full
+    # index on the skewed is_active boolean is near-useless to the planner;
+    # the partial index below matches get_active_deals_by_category exactly
     __table_args__ = (
-        Index('idx_deals_external_id', 'external_id'),
         Index('idx_deals_category', 'category_id'),
-        Index('idx_deals_active', 'is_active'),
+        Index(
+            'idx_deals_active_by_cat', 'category_id',
+            postgresql_where=text('is_active = true')
+        ),
         Index('idx_deals_extra_data', 'extra_data', postgresql_using='gin'),
         Index('idx_deals_first_seen', 'first_seen_at'),
     )
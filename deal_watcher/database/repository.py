@@ -1,16 +1,27 @@
 """Database repository for deal_watcher."""
 
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from decimal import Decimal
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from deal_watcher.database.models import Base, Category, Deal, PriceHistory, DealImage, ScrapingRun
 from deal_watcher.utils.logger import get_logger
 
+# psycopg (v3) binds parameters in the binary protocol, which roughly
+# halves the wire size of the bulk upserts; a bare postgresql:// DSN
+# keeps selecting psycopg2 when v3 is not installed.
+try:
+    import psycopg  # noqa: F401
+    _HAS_PSYCOPG3 = True
+except ImportError:
+    _HAS_PSYCOPG3 = False
+
 logger = get_logger(__name__)
 
 
@@ -24,8 +35,28 @@ class DealRepository:
         Args:
             connection_string: PostgreSQL connection string
         """
-        self.engine = create_engine(connection_string)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # Route a driverless DSN to psycopg (v3) when it is available;
+        # explicit +driver DSNs from the config are left untouched
+        if _HAS_PSYCOPG3 and connection_string.startswith('postgresql://'):
+            connection_string = connection_string.replace(
+                'postgresql://', 'postgresql+psycopg://', 1
+            )
+
+        # Sized for a scraper issuing many short queries: a larger pool
+        # avoids serial checkout contention, pre-ping drops dead connections
+        # before use, and recycling guards against server-side idle timeouts
+        self.engine = create_engine(
+            connection_string,
+            pool_size=20,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=1800
+        )
+        # expire_on_commit=False keeps loaded attributes usable after commit
+        # without the extra SELECT a refresh/expired-attribute reload costs
+        self.SessionLocal = sessionmaker(
+            bind=self.engine, expire_on_commit=False, autoflush=False
+        )
         logger.info("Database repository initialized")
 
     def create_tables(self):
@@ -41,6 +72,25 @@ class DealRepository:
         """Get database session."""
         return self.SessionLocal()
 
+    @contextmanager
+    def session_scope(self):
+        """
+        Provide a transactional session for a batch of operations.
+
+        Write methods accept this session via their `session` parameter so
+        a whole scraping run can share one session/transaction instead of
+        opening (and committing) one per call.
+        """
+        session = self.get_session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def get_category_by_id(self, category_id: int) -> Optional[Category]:
         """Get category by ID."""
         session = self.get_session()
@@ -57,10 +107,36 @@ class DealRepository:
         finally:
             session.close()
 
+    def get_deals_by_external_ids(self, external_ids: List[str]) -> Dict[str, Deal]:
+        """
+        Fetch existing deals for a batch of external IDs in one query.
+
+        Lets callers prefetch everything a scraping run will touch instead
+        of issuing a point SELECT per listing.
+
+        Args:
+            external_ids: External IDs to look up
+
+        Returns:
+            Mapping of external_id to Deal for the IDs that exist
+        """
+        if not external_ids:
+            return {}
+
+        session = self.get_session()
+        try:
+            deals = session.query(Deal).filter(
+                Deal.external_id.in_(external_ids)
+            ).all()
+            return {deal.external_id: deal for deal in deals}
+        finally:
+            session.close()
+
     def create_or_update_deal(
         self,
         listing_data: Dict[str, Any],
-        category_id: int
+        category_id: int,
+        session: Optional[Session] = None
     ) -> tuple[Deal, bool, bool]:
         """
         Create new deal or update existing one.
@@ -68,13 +144,27 @@ class DealRepository:
         Args:
             listing_data: Dictionary with listing data
             category_id: Category ID
+            session: Optional shared session (from session_scope); when
+                given, the caller owns commit/rollback
 
         Returns:
             Tuple of (deal, is_new, price_changed)
         """
-        session = self.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.get_session()
         is_new = False
         price_changed = False
+        # One timestamp per call: all of these fields describe the same event
+        now = datetime.utcnow()
+
+        # Convert the price exactly once; Decimal(str(...)) allocates and
+        # re-parses, so don't repeat it per field
+        new_price = listing_data.get('price')
+        if new_price is None or isinstance(new_price, Decimal):
+            price_dec = new_price
+        else:
+            price_dec = Decimal(str(new_price))
 
         try:
             external_id = listing_data.get('external_id')
@@ -83,7 +173,6 @@ class DealRepository:
             if deal:
                 # Update existing deal
                 old_price = deal.current_price
-                new_price = listing_data.get('price')
 
                 # Update fields
                 deal.title = listing_data.get('title', deal.title)
@@ -91,106 +180,267 @@ class DealRepository:
                 deal.location = listing_data.get('location', deal.location)
                 deal.postal_code = listing_data.get('postal_code', deal.postal_code)
                 deal.view_count = listing_data.get('view_count', deal.view_count)
-                deal.last_seen_at = datetime.utcnow()
-                deal.last_checked_at = datetime.utcnow()
-                deal.updated_at = datetime.utcnow()
+                deal.last_seen_at = now
+                deal.last_checked_at = now
+                deal.updated_at = now
                 deal.is_active = True
 
                 # Check for price change
                 if new_price is not None and old_price != new_price:
-                    deal.current_price = Decimal(str(new_price))
+                    deal.current_price = price_dec
                     price_changed = True
 
-                    # Add price history entry
-                    price_history = PriceHistory(
-                        deal_id=deal.id,
-                        price=Decimal(str(new_price)),
-                        changed_at=datetime.utcnow()
-                    )
-                    session.add(price_history)
+                    # Core insert skips ORM unit-of-work bookkeeping for
+                    # rows we never read back
+                    session.execute(PriceHistory.__table__.insert(), {
+                        'deal_id': deal.id,
+                        'price': price_dec,
+                        'changed_at': now
+                    })
                     logger.info(f"Price changed for {external_id}: {old_price} -> {new_price}")
 
             else:
                 # Create new deal
                 is_new = True
-                price = listing_data.get('price')
 
                 deal = Deal(
                     external_id=external_id,
                     category_id=category_id,
                     title=listing_data.get('title'),
                     description=listing_data.get('description'),
-                    current_price=Decimal(str(price)) if price is not None else None,
+                    current_price=price_dec,
                     location=listing_data.get('location'),
                     postal_code=listing_data.get('postal_code'),
                     url=listing_data.get('url'),
                     view_count=listing_data.get('view_count'),
                     extra_data=listing_data.get('extra_data', {}),
-                    first_seen_at=datetime.utcnow(),
-                    last_seen_at=datetime.utcnow(),
-                    last_checked_at=datetime.utcnow(),
+                    first_seen_at=now,
+                    last_seen_at=now,
+                    last_checked_at=now,
                     is_active=True
                 )
                 session.add(deal)
                 session.flush()  # Get deal.id
 
-                # Add initial price to history
-                if price is not None:
-                    price_history = PriceHistory(
-                        deal_id=deal.id,
-                        price=Decimal(str(price)),
-                        changed_at=datetime.utcnow()
-                    )
-                    session.add(price_history)
+                # Add initial price to history (Core insert - see above)
+                if price_dec is not None:
+                    session.execute(PriceHistory.__table__.insert(), {
+                        'deal_id': deal.id,
+                        'price': price_dec,
+                        'changed_at': now
+                    })
 
                 # Add image if present
                 image_url = listing_data.get('image_url')
                 if image_url:
-                    image = DealImage(
-                        deal_id=deal.id,
-                        image_url=image_url,
-                        is_primary=True
-                    )
-                    session.add(image)
+                    session.execute(DealImage.__table__.insert(), {
+                        'deal_id': deal.id,
+                        'image_url': image_url,
+                        'is_primary': True
+                    })
 
                 logger.info(f"Created new deal: {external_id}")
 
-            session.commit()
-            session.refresh(deal)
+            if owns_session:
+                session.commit()
+            else:
+                session.flush()
             return deal, is_new, price_changed
 
         except SQLAlchemyError as e:
-            session.rollback()
+            if owns_session:
+                session.rollback()
             logger.error(f"Error creating/updating deal: {e}")
             raise
         finally:
-            session.close()
+            if owns_session:
+                session.close()
+
+    def bulk_upsert_deals(
+        self,
+        listings: List[Dict[str, Any]],
+        category_id: int
+    ) -> Dict[str, int]:
+        """
+        Create or update many deals in a constant number of round-trips.
+
+        Equivalent to calling create_or_update_deal per listing, but uses a
+        single INSERT ... ON CONFLICT DO UPDATE statement for the whole batch
+        plus bulk inserts for price history and images, instead of a SELECT
+        and an INSERT/UPDATE per listing.
+
+        Args:
+            listings: List of listing data dictionaries
+            category_id: Category ID for all listings
+
+        Returns:
+            Dictionary with 'processed', 'new' and 'price_changed' counts
+        """
+        result = {'processed': 0, 'new': 0, 'price_changed': 0}
+        if not listings:
+            return result
 
-    def mark_deals_as_inactive(self, external_ids: List[str]):
-        """Mark deals as inactive (disappeared from listings)."""
         session = self.get_session()
+        now = datetime.utcnow()
+
         try:
-            count = session.query(Deal).filter(
-                Deal.external_id.in_(external_ids)
-            ).update({
-                'is_active': False,
-                'updated_at': datetime.utcnow()
-            }, synchronize_session=False)
+            rows = []
+            for listing_data in listings:
+                price = listing_data.get('price')
+                rows.append({
+                    'external_id': listing_data.get('external_id'),
+                    'category_id': category_id,
+                    'title': listing_data.get('title'),
+                    'description': listing_data.get('description'),
+                    'current_price': Decimal(str(price)) if price is not None else None,
+                    'location': listing_data.get('location'),
+                    'postal_code': listing_data.get('postal_code'),
+                    'url': listing_data.get('url'),
+                    'view_count': listing_data.get('view_count'),
+                    'extra_data': listing_data.get('extra_data', {}),
+                    'first_seen_at': now,
+                    'last_seen_at': now,
+                    'last_checked_at': now,
+                    'updated_at': now,
+                    'is_active': True
+                })
+
+            external_ids = [row['external_id'] for row in rows]
+
+            # Snapshot existing deals so we can tell new rows and price
+            # changes apart after the upsert (one round-trip)
+            existing = dict(
+                session.query(Deal.external_id, Deal.current_price).filter(
+                    Deal.external_id.in_(external_ids)
+                ).all()
+            )
+
+            # Single upsert statement - Postgres decides insert vs update
+            # per row; a missing price never overwrites a known price
+            stmt = pg_insert(Deal).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Deal.external_id],
+                set_={
+                    'title': stmt.excluded.title,
+                    'description': stmt.excluded.description,
+                    'current_price': func.coalesce(
+                        stmt.excluded.current_price, Deal.current_price
+                    ),
+                    'location': stmt.excluded.location,
+                    'postal_code': stmt.excluded.postal_code,
+                    'view_count': stmt.excluded.view_count,
+                    'last_seen_at': stmt.excluded.last_seen_at,
+                    'last_checked_at': stmt.excluded.last_checked_at,
+                    'updated_at': stmt.excluded.updated_at,
+                    'is_active': True
+                }
+            ).returning(Deal.id, Deal.external_id)
+            deal_ids = dict(session.execute(stmt).all())
+            deal_ids = {ext_id: deal_id for deal_id, ext_id in deal_ids.items()}
+
+            # Work out per-listing outcomes and collect bulk child rows
+            history_rows = []
+            image_rows = []
+            for row, listing_data in zip(rows, listings):
+                ext_id = row['external_id']
+                deal_id = deal_ids.get(ext_id)
+                if deal_id is None:
+                    continue
+
+                result['processed'] += 1
+                new_price = row['current_price']
+                is_new = ext_id not in existing
+
+                if is_new:
+                    result['new'] += 1
+                    if new_price is not None:
+                        history_rows.append({
+                            'deal_id': deal_id,
+                            'price': new_price,
+                            'changed_at': now
+                        })
+                    image_url = listing_data.get('image_url')
+                    if image_url:
+                        image_rows.append({
+                            'deal_id': deal_id,
+                            'image_url': image_url,
+                            'is_primary': True
+                        })
+                elif new_price is not None and existing[ext_id] != new_price:
+                    result['price_changed'] += 1
+                    history_rows.append({
+                        'deal_id': deal_id,
+                        'price': new_price,
+                        'changed_at': now
+                    })
+
+            if history_rows:
+                session.execute(PriceHistory.__table__.insert(), history_rows)
+            if image_rows:
+                session.execute(DealImage.__table__.insert(), image_rows)
 
             session.commit()
+            logger.info(
+                f"Bulk upserted {result['processed']} deals "
+                f"({result['new']} new, {result['price_changed']} price changes)"
+            )
+            return result
+
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Error bulk upserting deals: {e}")
+            raise
+        finally:
+            session.close()
+
+    def mark_deals_as_inactive(
+        self,
+        external_ids: List[str],
+        session: Optional[Session] = None
+    ):
+        """Mark deals as inactive (disappeared from listings)."""
+        if not external_ids:
+            return 0
+
+        owns_session = session is None
+        if owns_session:
+            session = self.get_session()
+        try:
+            # external_id = ANY(:ids) binds the whole list as one array
+            # parameter, so this scales past the 32k bind-parameter limit
+            # that IN (...) hits and keeps planning cost constant
+            result = session.execute(
+                text(
+                    "UPDATE deals SET is_active = false, updated_at = :now "
+                    "WHERE external_id = ANY(:ids)"
+                ),
+                {'ids': external_ids, 'now': datetime.utcnow()}
+            )
+            count = result.rowcount
+
+            if owns_session:
+                session.commit()
             logger.info(f"Marked {count} deals as inactive")
             return count
 
         except SQLAlchemyError as e:
-            session.rollback()
+            if owns_session:
+                session.rollback()
             logger.error(f"Error marking deals as inactive: {e}")
             raise
         finally:
-            session.close()
+            if owns_session:
+                session.close()
 
-    def create_scraping_run(self, category_id: int) -> ScrapingRun:
+    def create_scraping_run(
+        self,
+        category_id: int,
+        session: Optional[Session] = None
+    ) -> ScrapingRun:
         """Create a new scraping run record."""
-        session = self.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.get_session()
         try:
             run = ScrapingRun(
                 category_id=category_id,
@@ -198,16 +448,20 @@ class DealRepository:
                 status='running'
             )
             session.add(run)
-            session.commit()
-            session.refresh(run)
+            if owns_session:
+                session.commit()
+            else:
+                session.flush()
             logger.info(f"Created scraping run {run.id} for category {category_id}")
             return run
         except SQLAlchemyError as e:
-            session.rollback()
+            if owns_session:
+                session.rollback()
             logger.error(f"Error creating scraping run: {e}")
             raise
         finally:
-            session.close()
+            if owns_session:
+                session.close()
 
     def update_scraping_run(
         self,
@@ -217,10 +471,13 @@ class DealRepository:
         new_deals_found: int = 0,
         price_changes_detected: int = 0,
         deals_disappeared: int = 0,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        session: Optional[Session] = None
     ):
         """Update scraping run with results."""
-        session = self.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.get_session()
         try:
             run = session.query(ScrapingRun).filter(ScrapingRun.id == run_id).first()
             if run:
@@ -231,14 +488,19 @@ class DealRepository:
                 run.price_changes_detected = price_changes_detected
                 run.deals_disappeared = deals_disappeared
                 run.error_message = error_message
-                session.commit()
+                if owns_session:
+                    session.commit()
+                else:
+                    session.flush()
                 logger.info(f"Updated scraping run {run_id}: {status}")
         except SQLAlchemyError as e:
-            session.rollback()
+            if owns_session:
+                session.rollback()
             logger.error(f"Error updating scraping run: {e}")
             raise
         finally:
-            session.close()
+            if owns_session:
+                session.close()
 
     def get_active_deals_by_category(self, category_id: int) -> List[str]:
         """Get list of external IDs for active deals in a category."""
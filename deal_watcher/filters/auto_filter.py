@@ -5,12 +5,23 @@ from typing import Dict, Any
 from deal_watcher.filters.base_filter import BaseFilter
 from deal_watcher.utils.logger import get_logger
 
+# One automaton over all four keyword lists finds every hit in a single
+# pass over the text, instead of one substring scan per keyword; fall
+# back to the per-keyword loops when not installed.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
 
 class AutoFilter(BaseFilter):
     """Filter for auto listings (BMW vehicles)."""
 
+    # Bound on the memoized decision cache; cleared wholesale when full
+    MATCH_CACHE_MAX = 4096
+
     def __init__(self, filter_config: Dict[str, Any]):
         """
         Initialize auto filter.
@@ -28,6 +39,46 @@ class AutoFilter(BaseFilter):
         self.price_min = filter_config.get('price_min')
         self.price_max = filter_config.get('price_max')
 
+        # Normalize keyword lists once here, so matches() only has to
+        # normalize the listing text and run C-level substring scans
+        self._keywords_any_norm = tuple(self._normalize_text(k) for k in self.keywords_any)
+        self._keywords_all_norm = tuple(self._normalize_text(k) for k in self.keywords_all)
+        self._keywords_engine_norm = tuple(self._normalize_text(k) for k in self.keywords_engine)
+        self._keywords_excluded_norm = tuple(self._normalize_text(k) for k in self.keywords_excluded)
+
+        # Memoized decisions keyed on the fields the filter actually reads,
+        # so re-filtering the same listing (quick pass, detail pass,
+        # re-scrape) costs a dict lookup instead of a full text scan
+        self._match_cache: Dict[tuple, bool] = {}
+
+        # Required distinct hits for the keywords_all check (duplicates
+        # in the config only need to be found once)
+        self._keywords_all_required = len(set(self._keywords_all_norm))
+
+        # Combined automaton across all four lists: one pass over the
+        # combined text collects every hit, then set membership answers
+        # the any/all/engine/excluded questions. A keyword may sit in
+        # several lists, so each word carries all its (group, keyword)
+        # labels. None means fall back to the per-keyword loops.
+        self._combined_automaton = None
+        if ahocorasick is not None:
+            labels: Dict[str, list] = {}
+            for group, keywords in (
+                ('any', self._keywords_any_norm),
+                ('all', self._keywords_all_norm),
+                ('engine', self._keywords_engine_norm),
+                ('excluded', self._keywords_excluded_norm),
+            ):
+                for keyword in keywords:
+                    if keyword:
+                        labels.setdefault(keyword, []).append((group, keyword))
+            if labels:
+                automaton = ahocorasick.Automaton()
+                for keyword, keyword_labels in labels.items():
+                    automaton.add_word(keyword, tuple(keyword_labels))
+                automaton.make_automaton()
+                self._combined_automaton = automaton
+
     def matches(self, listing: Dict[str, Any], detailed: bool = False) -> bool:
         """
         Check if listing matches BMW filter criteria.
@@ -39,16 +90,48 @@ class AutoFilter(BaseFilter):
         Returns:
             True if listing matches all criteria
         """
-        title = listing.get('title', '')
-        description = listing.get('description', '')
-        combined_text = f"{title} {description}"
+        cache_key = (
+            listing.get('title', ''),
+            listing.get('description', ''),
+            listing.get('price'),
+            detailed
+        )
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._evaluate(listing, detailed)
+        if len(self._match_cache) >= self.MATCH_CACHE_MAX:
+            self._match_cache.clear()
+        self._match_cache[cache_key] = result
+        return result
+
+    def _evaluate(self, listing: Dict[str, Any], detailed: bool) -> bool:
+        """
+        Evaluate the filter criteria for a listing (uncached).
+
+        Args:
+            listing: Listing data
+            detailed: Whether this is detailed data (full description available)
+
+        Returns:
+            True if listing matches all criteria
+        """
+        # Normalize once per call - every keyword check below works on the
+        # already-normalized text instead of re-normalizing per keyword
+        title_norm = self._normalize_text(listing.get('title', ''))
 
         # QUICK FILTER (detailed=False): Only check title and price
         # This is lenient because list page has truncated descriptions
         if not detailed:
             # Only check if model is mentioned in TITLE (very likely to be there)
-            if self.keywords_any:
-                if not self._text_contains_any(title, self.keywords_any):
+            if self._keywords_any_norm:
+                if ahocorasick is not None:
+                    automaton = self._get_automaton(self._keywords_any_norm)
+                    found = next(automaton.iter(title_norm), None) is not None
+                else:
+                    found = any(k in title_norm for k in self._keywords_any_norm)
+                if not found:
                     logger.debug(f"Listing {listing.get('external_id')} quick-rejected: no model in title")
                     return False
 
@@ -67,29 +150,64 @@ class AutoFilter(BaseFilter):
             return True
 
         # FULL FILTER (detailed=True): Check everything in full description
-        # Check if any model keyword matches (E36, E46, E39)
-        if self.keywords_any:
-            if not self._text_contains_any(combined_text, self.keywords_any):
-                logger.debug(f"Listing {listing.get('external_id')} rejected: no model match")
+        # The combined string is only needed (and allocated) here - the
+        # quick path above never reads the description
+        description_norm = self._normalize_text(listing.get('description', ''))
+        combined_norm = f"{title_norm} {description_norm}"
+
+        if self._combined_automaton is not None:
+            # Single pass over the text; hits are bucketed by group so
+            # every predicate below is a constant-time lookup
+            hit_groups: Dict[str, set] = {}
+            for _, keyword_labels in self._combined_automaton.iter(combined_norm):
+                for group, keyword in keyword_labels:
+                    hit_groups.setdefault(group, set()).add(keyword)
+
+            # Excluded first - one hit rejects outright, which is the
+            # most selective check on typical listings
+            if self._keywords_excluded_norm and 'excluded' in hit_groups:
+                logger.debug(f"Listing {listing.get('external_id')} rejected: contains excluded keyword")
                 return False
 
-        # Check if all required keywords are present (benzin, manuál)
-        if self.keywords_all:
-            if not self._text_contains_all(combined_text, self.keywords_all):
-                logger.debug(f"Listing {listing.get('external_id')} rejected: missing required keywords")
+            # Any model keyword (E36, E46, E39)
+            if self._keywords_any_norm and 'any' not in hit_groups:
+                logger.debug(f"Listing {listing.get('external_id')} rejected: no model match")
                 return False
 
-        # Check if at least one engine keyword is present (6 valec, etc.)
-        if self.keywords_engine:
-            if not self._text_contains_any(combined_text, self.keywords_engine):
+            # All required keywords (benzin, manuál): count distinct hits
+            if self._keywords_all_norm:
+                if len(hit_groups.get('all', ())) < self._keywords_all_required:
+                    logger.debug(f"Listing {listing.get('external_id')} rejected: missing required keywords")
+                    return False
+
+            # At least one engine keyword (6 valec, etc.)
+            if self._keywords_engine_norm and 'engine' not in hit_groups:
                 logger.debug(f"Listing {listing.get('external_id')} rejected: no engine match")
                 return False
+        else:
+            # Check if any model keyword matches (E36, E46, E39)
+            if self._keywords_any_norm:
+                if not any(k in combined_norm for k in self._keywords_any_norm):
+                    logger.debug(f"Listing {listing.get('external_id')} rejected: no model match")
+                    return False
 
-        # Check excluded keywords
-        if self.keywords_excluded:
-            if not self._text_excludes_all(combined_text, self.keywords_excluded):
-                logger.debug(f"Listing {listing.get('external_id')} rejected: contains excluded keyword")
-                return False
+            # Check if all required keywords are present (benzin, manuál)
+            if self._keywords_all_norm:
+                if not all(k in combined_norm for k in self._keywords_all_norm):
+                    logger.debug(f"Listing {listing.get('external_id')} rejected: missing required keywords")
+                    return False
+
+            # Check if at least one engine keyword is present (6 valec, etc.)
+            if self._keywords_engine_norm:
+                if not any(k in combined_norm for k in self._keywords_engine_norm):
+                    logger.debug(f"Listing {listing.get('external_id')} rejected: no engine match")
+                    return False
+
+            # Check excluded keywords
+            if self._keywords_excluded_norm:
+                if any(k in combined_norm for k in self._keywords_excluded_norm):
+                    logger.debug(f"Listing {listing.get('external_id')} rejected: contains excluded keyword")
+                    return False
 
         # Check price range
         price = listing.get('price')
@@ -6,12 +6,29 @@ from typing import Dict, Any
 
 from deal_watcher.utils.logger import get_logger
 
+# Aho-Corasick matches all keywords in one linear pass over the text
+# instead of one substring scan per keyword; fall back gracefully.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
+# Translation table deleting every combining mark (accent) codepoint.
+# Built once at import; str.translate with it runs in C, replacing the
+# per-character unicodedata.category call the old generator paid for.
+_COMBINING_MARKS = dict.fromkeys(
+    cp for cp in range(0x110000) if unicodedata.category(chr(cp)) == 'Mn'
+)
+
 
 class BaseFilter(ABC):
     """Abstract base class for all filters."""
 
+    # Bound on the normalized-text memo; cleared wholesale when full
+    NORM_CACHE_MAX = 2048
+
     def __init__(self, filter_config: Dict[str, Any]):
         """
         Initialize base filter.
@@ -20,6 +37,53 @@ class BaseFilter(ABC):
             filter_config: Filter configuration dictionary
         """
         self.config = filter_config
+        # Automatons built lazily per normalized keyword tuple and reused
+        # across calls, so compilation cost is paid once per keyword list
+        self._automaton_cache: Dict[tuple, Any] = {}
+        # The same combined title+description string is normalized by
+        # several helpers per listing; memoize so NFD runs once per string
+        self._norm_cache: Dict[str, str] = {}
+        # Keyword lists come from config and never change, so their
+        # normalized forms are cached by value - the tuple hash is
+        # trivial next to the normalization pass it saves, and unlike
+        # id() it cannot collide when a caller's list gets recycled
+        self._normalized_keyword_cache: Dict[tuple, tuple] = {}
+
+    def _normalize_keywords(self, keywords: list) -> tuple:
+        """
+        Get (normalizing once) the normalized tuple for a keyword list.
+
+        Args:
+            keywords: Raw keyword list
+
+        Returns:
+            Tuple of normalized keywords
+        """
+        cache_key = tuple(keywords)
+        normalized = self._normalized_keyword_cache.get(cache_key)
+        if normalized is None:
+            normalized = tuple(self._normalize_text(k) for k in keywords)
+            self._normalized_keyword_cache[cache_key] = normalized
+        return normalized
+
+    def _get_automaton(self, normalized_keywords: tuple):
+        """
+        Get (building if needed) the Aho-Corasick automaton for a keyword tuple.
+
+        Args:
+            normalized_keywords: Tuple of already-normalized keywords
+
+        Returns:
+            Compiled automaton for the keywords
+        """
+        automaton = self._automaton_cache.get(normalized_keywords)
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(normalized_keywords):
+                automaton.add_word(keyword, index)
+            automaton.make_automaton()
+            self._automaton_cache[normalized_keywords] = automaton
+        return automaton
 
     @abstractmethod
     def matches(self, listing: Dict[str, Any], detailed: bool = False) -> bool:
@@ -35,6 +99,33 @@ class BaseFilter(ABC):
         """
         pass
 
+    def matches_batch(self, listings: list, detailed: bool = False) -> list:
+        """
+        Evaluate the filter over a batch of listings.
+
+        A listing whose evaluation raises is treated as a non-match
+        rather than aborting the batch, mirroring how the processing
+        loops skip individual bad listings.
+
+        Args:
+            listings: Listing data dictionaries
+            detailed: Whether these are detailed data (from detail pages)
+
+        Returns:
+            One boolean verdict per listing, in order
+        """
+        verdicts = []
+        for listing in listings:
+            try:
+                verdicts.append(self.matches(listing, detailed=detailed))
+            except Exception as e:
+                logger.error(
+                    "Error filtering listing %s: %s",
+                    listing.get('external_id'), e
+                )
+                verdicts.append(False)
+        return verdicts
+
     def _normalize_text(self, text: str) -> str:
         """
         Normalize text for comparison (lowercase, remove accents, remove extra whitespace).
@@ -50,12 +141,26 @@ class BaseFilter(ABC):
         """
         if not text:
             return ''
-        # Decompose unicode characters (é -> e + ́), then remove combining characters
-        normalized = unicodedata.normalize('NFD', text)
-        # Remove combining characters (accents)
-        without_accents = ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
+
+        # ASCII fast path: no accents to strip, so skip NFD (and the memo)
+        # entirely - isascii/lower/split all run at C level
+        if text.isascii():
+            return ' '.join(text.lower().split())
+
+        cached = self._norm_cache.get(text)
+        if cached is not None:
+            return cached
+
+        # Decompose unicode characters (é -> e + ́), then drop the combining
+        # characters (accents) with a single C-level translate pass
+        without_accents = unicodedata.normalize('NFD', text).translate(_COMBINING_MARKS)
         # Lowercase and remove extra whitespace
-        return ' '.join(without_accents.lower().strip().split())
+        result = ' '.join(without_accents.lower().strip().split())
+
+        if len(self._norm_cache) >= self.NORM_CACHE_MAX:
+            self._norm_cache.clear()
+        self._norm_cache[text] = result
+        return result
 
     def _text_contains_any(self, text: str, keywords: list) -> bool:
         """
@@ -72,9 +177,13 @@ class BaseFilter(ABC):
             return False
 
         normalized_text = self._normalize_text(text)
+        normalized_keywords = self._normalize_keywords(keywords)
 
-        for keyword in keywords:
-            normalized_keyword = self._normalize_text(keyword)
+        if ahocorasick is not None:
+            automaton = self._get_automaton(normalized_keywords)
+            return next(automaton.iter(normalized_text), None) is not None
+
+        for normalized_keyword in normalized_keywords:
             if normalized_keyword in normalized_text:
                 return True
 
@@ -98,9 +207,22 @@ class BaseFilter(ABC):
             return False
 
         normalized_text = self._normalize_text(text)
-
-        for keyword in keywords:
-            normalized_keyword = self._normalize_text(keyword)
+        normalized_keywords = self._normalize_keywords(keywords)
+
+        if ahocorasick is not None:
+            automaton = self._get_automaton(normalized_keywords)
+            seen = set()
+            # Count distinct keywords: add_word keeps one value per
+            # repeated key, so duplicates (or keywords that normalize
+            # to the same string) must only be required once
+            wanted = len(set(normalized_keywords))
+            for _, index in automaton.iter(normalized_text):
+                seen.add(index)
+                if len(seen) == wanted:
+                    return True
+            return len(seen) == wanted
+
+        for normalized_keyword in normalized_keywords:
             if normalized_keyword not in normalized_text:
                 return False
 
@@ -124,9 +246,13 @@ class BaseFilter(ABC):
             return True
 
         normalized_text = self._normalize_text(text)
+        normalized_keywords = self._normalize_keywords(keywords)
+
+        if ahocorasick is not None:
+            automaton = self._get_automaton(normalized_keywords)
+            return next(automaton.iter(normalized_text), None) is None
 
-        for keyword in keywords:
-            normalized_keyword = self._normalize_text(keyword)
+        for normalized_keyword in normalized_keywords:
             if normalized_keyword in normalized_text:
                 return False
 
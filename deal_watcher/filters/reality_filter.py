@@ -1,17 +1,81 @@
 """Reality filter for land/houses/cottages."""
 
+import logging
 import re
 from typing import Dict, Any, Optional
 
 from deal_watcher.filters.base_filter import BaseFilter
 from deal_watcher.utils.logger import get_logger
 
+# RE2 matches with a DFA (no backtracking), which suits the area pattern's
+# bounded context windows and unit alternation; fall back to stdlib re.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# One Aho-Corasick automaton can carry excluded keywords, area units and
+# land/floor context words at once, so the detailed filter classifies a
+# listing in a single pass over the text; fall back to the two-pass path.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
+# Comprehensive pattern for area with context (60 chars before and after)
+# This captures: "pozemok 5000 m2" or "úžitková plocha 120 m²"
+# Number pattern matches: "5", "50000", "50 000", "4.2", "4,5"
+# Note: .{0,60}? is non-greedy to avoid consuming digits from the number
+# Groups: (1) context before, (2) number, (3) unit, (4) context after
+# Compiled once at import so per-listing calls skip the re cache lookup
+# (?i) is the inline IGNORECASE flag, understood by both engines
+_AREA_PATTERN = _regex.compile(
+    r'(?i)(.{0,60}?)(\d+(?:[\s,]\d+)*(?:[.,]\d+)?)\s*'
+    r'(m2|m²|metrov\s*štvorcových|metrov|ha|hektár|hektárov|árov|arov|ár|a)'
+    r'(.{0,60})'
+)
+
+# Anchored number parse for the fused scan: on a unit hit, the number is
+# read from the short window of text directly before the unit token
+_NUMBER_BEFORE_RE = _regex.compile(r'(\d+(?:[\s,]\d+)*(?:[.,]\d+)?)\s*$')
+
+# Number cleanup in one C-level translate pass: drop thousands-separator
+# spaces and turn decimal commas into dots
+_NUM_TABLE = str.maketrans({' ': None, ',': '.'})
+
+# Land/floor context classifiers as single alternation regexes: one
+# C-level walk of the context window instead of a Python loop doing a
+# full substring scan per keyword
+_LAND_RE = _regex.compile('|'.join(map(re.escape, (
+    'pozemok', 'parcela', 'pozemku', 'parcely', 'land', 'ha', 'hektár',
+))))
+_FLOOR_RE = _regex.compile('|'.join(map(re.escape, (
+    'podlahov', 'užitkov', 'zastaven', 'obytná', 'floor', 'úžitkov',
+))))
+
 
 class RealityFilter(BaseFilter):
     """Filter for reality listings (land, houses, cottages)."""
 
+    # Vocabulary for the fused scan, stored accent-stripped because the
+    # scan walks normalized text. Unit factors convert to m².
+    _UNIT_FACTORS = {
+        'm2': 1.0,
+        'm²': 1.0,
+        'metrov stvorcovych': 1.0,
+        'metrov': 1.0,
+        'ha': 10000.0,
+        'hektar': 10000.0,
+        'hektarov': 10000.0,
+        'arov': 100.0,
+        'ar': 100.0,
+        'a': 1.0,
+    }
+    _LAND_CONTEXT = ('pozemok', 'parcela', 'pozemku', 'parcely', 'land')
+    _FLOOR_CONTEXT = ('podlahov', 'uzitkov', 'zastaven', 'obytna', 'floor')
+
     def __init__(self, filter_config: Dict[str, Any]):
         """
         Initialize reality filter.
@@ -29,6 +93,38 @@ class RealityFilter(BaseFilter):
         self.keywords_excluded = filter_config.get('keywords_excluded', [])
         self.reject_price_per_m2 = filter_config.get('reject_price_per_m2', True)  # Default True
 
+        # Normalize the excluded keywords once here instead of per call
+        self._keywords_excluded_norm = tuple(self._normalize_text(k) for k in self.keywords_excluded)
+
+        # Fused automaton for the single-pass detailed scan; None means
+        # fall back to the separate area regex + exclusion scans
+        self._fused_automaton = self._build_fused_automaton() if ahocorasick is not None else None
+
+    def _build_fused_automaton(self):
+        """
+        Build the combined automaton for the single-pass detailed scan.
+
+        Entries are tagged with (kind, length, factor): area units carry
+        their m² conversion factor, land/floor context words classify
+        nearby areas, and excluded keywords reject the listing outright.
+
+        Returns:
+            Compiled ahocorasick.Automaton
+        """
+        automaton = ahocorasick.Automaton()
+        for unit, factor in self._UNIT_FACTORS.items():
+            automaton.add_word(unit, ('unit', len(unit), factor))
+        for keyword in self._LAND_CONTEXT:
+            automaton.add_word(keyword, ('land', len(keyword), None))
+        for keyword in self._FLOOR_CONTEXT:
+            automaton.add_word(keyword, ('floor', len(keyword), None))
+        # Excluded keywords go last so they win any collision with a
+        # context word - an excluded hit rejects the listing outright
+        for keyword in self._keywords_excluded_norm:
+            automaton.add_word(keyword, ('excl', len(keyword), None))
+        automaton.make_automaton()
+        return automaton
+
     def matches(self, listing: Dict[str, Any], detailed: bool = False) -> bool:
         """
         Check if listing matches reality filter criteria.
@@ -40,100 +136,201 @@ class RealityFilter(BaseFilter):
         Returns:
             True if listing matches all criteria
         """
+        # Bind the hot fields once - matches() runs over thousands of
+        # listings and repeated dict lookups (plus debug f-strings when
+        # debug logging is off) add up
+        external_id = listing.get('external_id')
+        price = listing.get('price')
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Title and description are scanned separately - building a
+        # combined f-string would allocate (and later normalize) a
+        # duplicate full-size buffer per listing
         title = listing.get('title', '')
         description = listing.get('description', '')
-        combined_text = f"{title} {description}"
 
         # QUICK FILTER (detailed=False): Only check price
         # Don't try to extract area from truncated description - it's often missing
         if not detailed:
             # Check price range (this IS reliably on list page)
-            price = listing.get('price')
             if price is not None:
                 if self.price_min is not None and price < self.price_min:
-                    logger.debug(f"Listing {listing.get('external_id')} quick-rejected: price too low")
+                    if debug:
+                        logger.debug(f"Listing {external_id} quick-rejected: price too low")
                     return False
 
                 if self.price_max is not None and price > self.price_max:
-                    logger.debug(f"Listing {listing.get('external_id')} quick-rejected: price {price} > {self.price_max}")
+                    if debug:
+                        logger.debug(f"Listing {external_id} quick-rejected: price {price} > {self.price_max}")
                     return False
 
             # Pass quick filter - fetch detail page to check area
-            logger.debug(f"Listing {listing.get('external_id')} passed quick filter")
+            if debug:
+                logger.debug(f"Listing {external_id} passed quick filter")
             return True
 
         # FULL FILTER (detailed=True): Check everything in full description
-        # Check excluded keywords
-        if self.keywords_excluded:
-            if not self._text_excludes_all(combined_text, self.keywords_excluded):
-                logger.debug(f"Listing {listing.get('external_id')} rejected: contains excluded keyword")
-                return False
-
+        # Ordered cheapest-first: integer price comparisons reject most
+        # listings before the regex area scan, and the keyword-exclusion
+        # text scan only runs for listings that survive both
         # Check price range
-        price = listing.get('price')
         if price is not None:
             # Reject suspiciously low prices (likely per-m² prices)
             if self.reject_price_per_m2 and price < 100:
-                logger.debug(f"Listing {listing.get('external_id')} rejected: suspiciously low price {price} EUR (likely per-m²)")
+                if debug:
+                    logger.debug(f"Listing {external_id} rejected: suspiciously low price {price} EUR (likely per-m²)")
                 return False
 
             if self.price_min is not None and price < self.price_min:
-                logger.debug(f"Listing {listing.get('external_id')} rejected: price too low")
+                if debug:
+                    logger.debug(f"Listing {external_id} rejected: price too low")
                 return False
 
             if self.price_max is not None and price > self.price_max:
-                logger.debug(f"Listing {listing.get('external_id')} rejected: price {price} > {self.price_max}")
+                if debug:
+                    logger.debug(f"Listing {external_id} rejected: price {price} > {self.price_max}")
                 return False
 
-        # Check area (now from FULL description)
-        area = self._extract_area(combined_text)
+        # Check area and excluded keywords (fused into one text pass
+        # when the automaton is available)
+        if self._fused_automaton is not None:
+            area, has_excluded = self._fused_scan(title, description)
+            if has_excluded:
+                if debug:
+                    logger.debug(f"Listing {external_id} rejected: contains excluded keyword")
+                return False
+        else:
+            area = self._extract_area(title, description)
+
         if area is None:
-            logger.debug(f"Listing {listing.get('external_id')} rejected: could not extract area")
+            if debug:
+                logger.debug(f"Listing {external_id} rejected: could not extract area")
             return False
 
         if area < self.area_min:
-            logger.debug(f"Listing {listing.get('external_id')} rejected: area {area} m² < {self.area_min} m²")
+            if debug:
+                logger.debug(f"Listing {external_id} rejected: area {area} m² < {self.area_min} m²")
             return False
 
-        logger.info(f"Listing {listing.get('external_id')} MATCHES filter criteria (area: {area} m², price: {price})")
+        # Check excluded keywords (most expensive check, so it runs last;
+        # already covered above when the fused scan ran)
+        if self.keywords_excluded and self._fused_automaton is None:
+            if not (self._text_excludes_all(title, self.keywords_excluded)
+                    and self._text_excludes_all(description, self.keywords_excluded)):
+                if debug:
+                    logger.debug(f"Listing {external_id} rejected: contains excluded keyword")
+                return False
+
+        logger.info(f"Listing {external_id} MATCHES filter criteria (area: {area} m², price: {price})")
         return True
 
-    def _extract_area(self, text: str) -> Optional[float]:
+    def _fused_scan(self, *texts):
         """
-        Extract land area from text, distinguishing from floor area.
+        Scan texts once for excluded keywords and land areas.
 
-        For houses, there are typically TWO areas:
-        - Floor area (podlahová plocha, úžitková plocha, zastavená plocha) - smaller
-        - Land area (pozemok, parcela) - larger, this is what we want
+        Walks each normalized text through the fused automaton a single
+        time: an excluded-keyword hit short-circuits, a unit hit anchors
+        a bounded-window number parse just before it, and land/floor
+        context hits within ±60 chars classify the candidate area.
 
         Args:
-            text: Text to extract area from
+            *texts: Texts to scan (e.g. title and description)
 
         Returns:
-            Land area in square meters or None if not found
+            Tuple of (land area in m² or None, excluded keyword found)
         """
-        if not text:
-            return None
+        # Streaming maxima - no list accumulation, -1 means "none found"
+        max_land = -1.0
+        max_all = -1.0
 
-        normalized_text = text.lower()
+        for text in texts:
+            if not text:
+                continue
+            normalized = self._normalize_text(text)
+
+            candidates = []  # (start, end, area_m2)
+            land_positions = []
+            floor_positions = []
+
+            for end, (kind, length, factor) in self._fused_automaton.iter(normalized):
+                if kind == 'excl':
+                    return None, True
+
+                start = end - length + 1
+                if kind == 'unit':
+                    # Number must sit directly before the unit token
+                    window = normalized[max(0, start - 24):start]
+                    number_match = _NUMBER_BEFORE_RE.search(window)
+                    if number_match:
+                        number_str = number_match.group(1).translate(_NUM_TABLE)
+                        try:
+                            if factor == 1.0 and '.' not in number_str:
+                                # Common case: whole number of m² - stay
+                                # in int, skipping the float round-trip
+                                area_value = int(number_str)
+                            else:
+                                area_value = float(number_str) * factor
+                        except ValueError:
+                            continue
+                        candidates.append((start, end, area_value))
+                    if factor == 10000.0:
+                        # Hectare units double as land context
+                        land_positions.append(start)
+                elif kind == 'land':
+                    land_positions.append(start)
+                else:
+                    floor_positions.append(start)
+
+            for start, end, area_m2 in candidates:
+                low, high = start - 60, end + 60
+                is_floor = any(low <= p <= high for p in floor_positions)
+                if area_m2 > max_all:
+                    max_all = area_m2
+                if not is_floor and area_m2 > max_land:
+                    max_land = area_m2
+
+        if max_land >= 0:
+            return max_land, False
+        if max_all > 5000:  # If > 5000 m², probably land even if not labeled
+            return max_all, False
+        return None, False
+
+    @staticmethod
+    def _iter_area_matches(texts):
+        """
+        Yield area pattern matches from each text in turn.
 
-        # Keywords indicating LAND area (good)
-        land_keywords = ['pozemok', 'parcela', 'pozemku', 'parcely', 'land', 'ha', 'hektár']
+        Args:
+            texts: Iterable of texts to scan (empty entries are skipped)
 
-        # Keywords indicating FLOOR area (bad - ignore these)
-        floor_keywords = ['podlahov', 'užitkov', 'zastaven', 'obytná', 'floor', 'úžitkov']
+        Yields:
+            Regex match objects from _AREA_PATTERN
+        """
+        for text in texts:
+            if not text:
+                continue
+            yield from _AREA_PATTERN.finditer(text.lower())
 
-        # Comprehensive pattern for area with context (60 chars before and after)
-        # This captures: "pozemok 5000 m2" or "úžitková plocha 120 m²"
-        # Number pattern matches: "5", "50000", "50 000", "4.2", "4,5"
-        # Note: .{0,60}? is non-greedy to avoid consuming digits from the number
-        # Groups: (1) context before, (2) number, (3) unit, (4) context after
-        pattern = r'(.{0,60}?)(\d+(?:[\s,]\d+)*(?:[.,]\d+)?)\s*(m2|m²|metrov\s*štvorcových|metrov|ha|hektár|hektárov|árov|arov|ár|a)(.{0,60})'
+    def _extract_area(self, *texts: str) -> Optional[float]:
+        """
+        Extract land area from texts, distinguishing from floor area.
 
-        land_areas = []
-        all_areas = []
+        For houses, there are typically TWO areas:
+        - Floor area (podlahová plocha, úžitková plocha, zastavená plocha) - smaller
+        - Land area (pozemok, parcela) - larger, this is what we want
+
+        Args:
+            *texts: Texts to extract area from (e.g. title and description,
+                passed separately to avoid concatenating them)
 
-        for match in re.finditer(pattern, normalized_text, re.IGNORECASE):
+        Returns:
+            Land area in square meters or None if not found
+        """
+        # Streaming maxima - no list accumulation, -1 means "none found"
+        max_land = -1.0
+        max_all = -1.0
+
+        for match in self._iter_area_matches(texts):
             try:
                 context_before = match.group(1).lower()
                 unit = match.group(3).lower()
@@ -141,48 +338,49 @@ class RealityFilter(BaseFilter):
                 context = context_before + ' ' + context_after
 
                 # Extract number
-                number_str = match.group(2).replace(' ', '').replace(',', '.')
-                value = float(number_str)
+                number_str = match.group(2).translate(_NUM_TABLE)
 
                 # Convert to m² based on unit
                 if 'ha' in unit or 'hektár' in unit:
-                    area_m2 = value * 10000
+                    area_m2 = float(number_str) * 10000
                 elif 'ár' in unit and 'hektár' not in unit:
-                    area_m2 = value * 100
+                    area_m2 = float(number_str) * 100
+                elif '.' not in number_str:
+                    # Common case: whole number of m² - parse and compare
+                    # as int, skipping the float round-trip
+                    area_m2 = int(number_str)
                 else:
-                    area_m2 = value
+                    area_m2 = float(number_str)
 
                 # Check if this is land or floor area based on context
-                is_land = any(kw in context for kw in land_keywords)
-                is_floor = any(kw in context for kw in floor_keywords)
+                # (precompiled alternations: _LAND_RE for pozemok/parcela/
+                # ha/..., _FLOOR_RE for podlahová/úžitková/zastavená/...)
+                is_land = _LAND_RE.search(context) is not None
+                is_floor = _FLOOR_RE.search(context) is not None
 
                 logger.debug(f"Found area: {area_m2} m² (land={is_land}, floor={is_floor}, context: ...{context_before[-30:]}...{context_after[:30]}...)")
 
-                all_areas.append(area_m2)
+                if area_m2 > max_all:
+                    max_all = area_m2
 
-                if is_land and not is_floor:
-                    land_areas.append(area_m2)
-                elif not is_floor:
-                    # No clear indicators, could be land
-                    land_areas.append(area_m2)
+                # Anything not clearly a floor area could be land
+                if not is_floor and area_m2 > max_land:
+                    max_land = area_m2
 
             except (ValueError, IndexError) as e:
                 logger.debug(f"Error parsing area: {e}")
                 continue
 
         # Return the largest land area found
-        if land_areas:
-            max_land = max(land_areas)
-            logger.debug(f"Selected land area: {max_land} m² from {len(land_areas)} candidates")
+        if max_land >= 0:
+            logger.debug(f"Selected land area: {max_land} m²")
             return max_land
-        elif all_areas:
+        if max_all >= 0:
             # No clear land area, return largest overall (might be mislabeled)
-            max_area = max(all_areas)
-            if max_area > 5000:  # If > 5000 m², probably land even if not labeled
-                logger.debug(f"No clear land area, but found large area: {max_area} m² (probably land)")
-                return max_area
-            else:
-                logger.debug(f"Only found small area: {max_area} m² (probably floor area)")
-                return None
+            if max_all > 5000:  # If > 5000 m², probably land even if not labeled
+                logger.debug(f"No clear land area, but found large area: {max_all} m² (probably land)")
+                return max_all
+            logger.debug(f"Only found small area: {max_all} m² (probably floor area)")
+            return None
 
         return None
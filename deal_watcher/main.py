@@ -3,9 +3,16 @@
 import os
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from dotenv import load_dotenv
 
+# orjson parses JSON in C; fall back to the stdlib when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from deal_watcher.utils.logger import setup_logger, get_logger
 from deal_watcher.utils.http_client import HTTPClient
 from deal_watcher.database.repository import DealRepository
@@ -32,27 +39,29 @@ def load_config(config_path: str = 'deal_watcher/config/config.json') -> Dict[st
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-
-        # Replace environment variables in connection string
-        db_config = config.get('database', {})
-        conn_string = db_config.get('connection_string', '')
-        if '${DB_CONNECTION_STRING}' in conn_string:
-            conn_string = os.getenv('DB_CONNECTION_STRING', '')
-            if not conn_string:
-                raise ValueError("DB_CONNECTION_STRING environment variable not set")
-            config['database']['connection_string'] = conn_string
-
-        return config
+        with open(config_path, 'rb') as f:
+            raw = f.read()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
         logger.error(f"Error parsing configuration file: {e}")
         sys.exit(1)
 
+    # Replace environment variables in connection string
+    db_config = config.get('database', {})
+    conn_string = db_config.get('connection_string', '')
+    if '${DB_CONNECTION_STRING}' in conn_string:
+        conn_string = os.getenv('DB_CONNECTION_STRING', '')
+        if not conn_string:
+            raise ValueError("DB_CONNECTION_STRING environment variable not set")
+        config['database']['connection_string'] = conn_string
+
+    return config
+
 
 def get_scraper(scraper_config: Dict[str, Any], http_client: HTTPClient, cache_manager=None):
     """
@@ -101,7 +110,8 @@ def process_scraper(
     scraper_config: Dict[str, Any],
     http_client: HTTPClient,
     repository: DealRepository,
-    cache_manager=None
+    cache_manager=None,
+    detail_workers: int = 8
 ) -> Dict[str, int]:
     """
     Process a single scraper configuration.
@@ -111,6 +121,7 @@ def process_scraper(
         http_client: HTTP client instance
         repository: Database repository
         cache_manager: Optional CacheManager instance
+        detail_workers: Thread count for parallel detail-page fetches
 
     Returns:
         Dictionary with statistics
@@ -138,27 +149,23 @@ def process_scraper(
         scraper = get_scraper(scraper_config, http_client, cache_manager)
         listing_filter = get_filter(scraper_config)
 
-        # Scrape listings
-        listings = scraper.run()
-        stats['listings_processed'] = len(listings)
+        # Scrape list pages and fetch detail pages as one fused pipeline
+        # (detail fetches overlap the list-page crawl). Filtering and
+        # database writes stay on this thread.
+        pairs = scraper.run_with_details(max_workers=detail_workers)
+        stats['listings_processed'] = len(pairs)
 
-        logger.info(f"Processing {len(listings)} listings...")
+        logger.info(f"Processing {len(pairs)} listings...")
 
-        # Process each listing
-        for listing in listings:
+        for listing, detail_data in pairs:
             try:
                 external_id = listing.get('external_id')
-                detail_url = listing.get('url')
 
                 # Save basic listing info to cache (all listings)
                 if cache_manager:
                     scraper.save_to_cache(listing)
                     stats['cached_listings'] += 1
 
-                # Fetch detailed data for ALL listings (no quick filter)
-                logger.debug(f"Fetching details for listing {external_id}")
-                detail_data = scraper.scrape_detail_page(detail_url)
-
                 if detail_data:
                     # Merge detail data into listing
                     listing.update(detail_data)
@@ -274,15 +281,40 @@ def main():
 
     logger.info(f"Found {len(enabled_scrapers)} enabled scrapers")
 
-    for scraper_config in enabled_scrapers:
-        stats = process_scraper(scraper_config, http_client, repository, cache_manager)
+    detail_workers = scraping_config.get('detail_workers', 8)
 
-        # Accumulate stats
-        for key in total_stats:
-            total_stats[key] += stats.get(key, 0)
+    # Scrapers are independent (mostly network-bound) and the repository
+    # opens a session per operation, so running them in threads brings
+    # total wall time down to the slowest scraper instead of the sum.
+    # Cleanup runs in a finally: the cache writer thread is a daemon, so
+    # skipping close() on an exception or Ctrl-C would silently discard
+    # queued listing snapshots (lost price history).
+    all_stats = []
+    try:
+        if len(enabled_scrapers) > 1:
+            with ThreadPoolExecutor(max_workers=len(enabled_scrapers)) as executor:
+                all_stats = list(executor.map(
+                    lambda cfg: process_scraper(
+                        cfg, http_client, repository, cache_manager,
+                        detail_workers=detail_workers
+                    ),
+                    enabled_scrapers
+                ))
+        elif enabled_scrapers:
+            all_stats = [process_scraper(
+                enabled_scrapers[0], http_client, repository, cache_manager,
+                detail_workers=detail_workers
+            )]
 
-    # Clean up
-    http_client.close()
+        # Accumulate stats
+        for stats in all_stats:
+            for key in total_stats:
+                total_stats[key] += stats.get(key, 0)
+    finally:
+        # Clean up
+        http_client.close()
+        if cache_manager:
+            cache_manager.close()
 
     # Print cache statistics
     if cache_manager:
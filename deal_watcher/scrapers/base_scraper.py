@@ -1,8 +1,17 @@
 """Base scraper abstract class."""
 
 import os
+import gzip
 import hashlib
+import json
+import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
@@ -10,12 +19,107 @@ from bs4 import BeautifulSoup
 from deal_watcher.utils.http_client import HTTPClient
 from deal_watcher.utils.logger import get_logger
 
+# Bazos HTML is repetitive markup that compresses ~10x, so the page cache
+# is stored compressed: zstd when available (same dependency the listing
+# cache uses), stdlib gzip otherwise. Plain '.html' files from older runs
+# are still readable.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+if zstandard is not None:
+    _PAGE_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+    _PAGE_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _url_cache_key(url: str) -> str:
+    """
+    Hash a URL into a filesystem cache key.
+
+    blake2b is noticeably cheaper per call than md5 (no OpenSSL EVP
+    setup) and matches the digest used by the listing cache; the
+    lru_cache memo makes repeat lookups for the same URL free.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        32-char hex digest
+    """
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class Listing:
+    """
+    One listing as parsed from a list page.
+
+    Slotted storage keeps per-record memory roughly half of the dict it
+    replaces and makes field access a fixed-offset load; the scraper
+    pipeline passes these around internally and converts to plain dicts
+    at its public boundaries (run, run_with_details, scrape_list_page),
+    where filters, cache and repository expect dict records.
+    """
+
+    external_id: str
+    title: str
+    url: str
+    price: Optional[float]
+    location: Optional[str]
+    postal_code: Optional[str]
+    view_count: Optional[int]
+    description: str
+    image_url: Optional[str]
+    posted_date: Optional[datetime]
+
+    def get(self, key: str, default=None):
+        """
+        Dict-style field access, so pipeline code that also sees plain
+        dict records (base-class default paths) needs no type checks.
+
+        Args:
+            key: Field name
+            default: Value returned when the field does not exist
+
+        Returns:
+            Field value or default
+        """
+        return getattr(self, key, default)
+
+    def asdict(self) -> Dict[str, Any]:
+        """
+        Convert to the plain dict record the rest of the system uses.
+
+        Hand-rolled instead of dataclasses.asdict, which recurses and
+        deep-copies; this is a single dict display.
+
+        Returns:
+            Listing fields as a dictionary
+        """
+        return {
+            'external_id': self.external_id,
+            'title': self.title,
+            'url': self.url,
+            'price': self.price,
+            'location': self.location,
+            'postal_code': self.postal_code,
+            'view_count': self.view_count,
+            'description': self.description,
+            'image_url': self.image_url,
+            'posted_date': self.posted_date
+        }
+
+
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
 
+    # Bound on the in-process page cache (raw bytes per entry)
+    PAGE_CACHE_MAX = 256
+
     def __init__(self, config: Dict[str, Any], http_client: HTTPClient, cache_manager=None):
         """
         Initialize base scraper.
@@ -45,6 +149,18 @@ class BaseScraper(ABC):
         if self.cache_pages and not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir, exist_ok=True)
 
+        # In-process LRU over raw page bytes: repeat fetches of the same
+        # URL within a run (retries, debug reruns) hit a dict lookup
+        # instead of the filesystem or the network
+        self._page_memory_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+
+        # In-flight fetch deduplication: when several workers ask for the
+        # same URL concurrently, the first one does the fetch and the rest
+        # wait on its future instead of issuing duplicate requests
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
     @abstractmethod
     def scrape_list_page(self, page_number: int = 0) -> List[Dict[str, Any]]:
         """
@@ -58,6 +174,21 @@ class BaseScraper(ABC):
         """
         pass
 
+    def iter_list_page(self, page_number: int = 0):
+        """
+        Yield listings from a list page one at a time.
+
+        The default just materializes scrape_list_page; subclasses can
+        override to defer per-item parsing for early-exiting callers.
+
+        Args:
+            page_number: Page number to scrape (0-indexed)
+
+        Yields:
+            Basic listing dictionaries in page order
+        """
+        yield from self.scrape_list_page(page_number)
+
     @abstractmethod
     def scrape_detail_page(self, listing_url: str) -> Optional[Dict[str, Any]]:
         """
@@ -84,47 +215,121 @@ class BaseScraper(ABC):
         """
         pass
 
-    def fetch_page(self, url: str, cache_key: Optional[str] = None) -> Optional[BeautifulSoup]:
+    def fetch_page_content(self, url: str, cache_key: Optional[str] = None) -> Optional[bytes]:
         """
-        Fetch and parse a page, with optional caching.
+        Fetch raw page bytes, with optional caching.
+
+        Callers choose the parser: the hot list-page path feeds the bytes
+        straight to lxml, while fetch_page wraps them in BeautifulSoup.
 
         Args:
             url: URL to fetch
             cache_key: Optional cache key (if not provided, uses URL hash)
 
         Returns:
-            BeautifulSoup object or None if fetch failed
+            Raw HTML bytes or None if fetch failed
         """
         # Generate cache filename
         if cache_key is None:
-            cache_key = hashlib.md5(url.encode()).hexdigest()
+            cache_key = _url_cache_key(url)
         cache_file = os.path.join(self.cache_dir, f"{cache_key}.html")
 
-        # Try to load from cache if enabled
-        if self.cache_pages and os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    logger.debug(f"Loading from cache: {cache_file}")
-                    return BeautifulSoup(f.read(), 'lxml')
-            except Exception as e:
-                logger.warning(f"Error loading cache {cache_file}: {e}")
+        # Memory cache first - repeat calls never touch the filesystem
+        with self._page_cache_lock:
+            cached = self._page_memory_cache.get(cache_key)
+            if cached is not None:
+                self._page_memory_cache.move_to_end(cache_key)
+                return cached
+
+        # Deduplicate concurrent fetches: the first caller owns the fetch,
+        # later callers for the same key block on its future and share the
+        # result instead of hitting the network twice
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            if future is None:
+                future = Future()
+                self._inflight[cache_key] = future
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return future.result()
+
+        try:
+            content = self._load_or_fetch_page(url, cache_key, cache_file)
+            future.set_result(content)
+            return content
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _load_or_fetch_page(self, url: str, cache_key: str, cache_file: str) -> Optional[bytes]:
+        """
+        Load page bytes from the disk cache or fetch them from the web.
+
+        Args:
+            url: URL to fetch
+            cache_key: Hashed URL key for the in-process LRU
+            cache_file: Disk cache path for this URL
+
+        Returns:
+            Raw HTML bytes or None if fetch failed
+        """
+        # Try to load from cache if enabled and still fresh; an expired
+        # entry is not discarded outright - its validators (ETag /
+        # Last-Modified) turn the refetch into a conditional GET below
+        conditional_headers = None
+        existing = self._find_cached_page(cache_file) if self.cache_pages else None
+        if existing is not None:
+            ttl = self._page_ttl_seconds(url)
+            expired = False
+            if ttl is not None:
+                try:
+                    expired = (time.time() - os.path.getmtime(existing)) > ttl
+                except OSError:
+                    expired = True
+            if expired:
+                logger.debug("Cache entry expired (ttl %ss): %s", ttl, existing)
+                conditional_headers = self._conditional_headers(cache_file) or None
+            else:
+                try:
+                    logger.debug("Loading from cache: %s", existing)
+                    content = self._read_cached_page(existing)
+                    self._remember_page(cache_key, content)
+                    return content
+                except Exception as e:
+                    logger.warning(f"Error loading cache {existing}: {e}")
 
         # Fetch from web
         try:
-            response = self.http_client.get(url)
+            response = self.http_client.get(url, headers=conditional_headers)
+            if response is not None and response.status_code == 304 and existing is not None:
+                # Server confirms the expired copy is still current: no
+                # body crossed the wire, so reuse the cached bytes and
+                # restart the TTL clock via mtime
+                logger.debug("Not modified, revalidated cache: %s", existing)
+                content = self._read_cached_page(existing)
+                os.utime(existing, None)
+                self._remember_page(cache_key, content)
+                return content
             if response and response.status_code == 200:
                 content = response.content
 
                 # Save to cache if enabled
                 if self.cache_pages:
                     try:
-                        with open(cache_file, 'wb') as f:
-                            f.write(content)
-                        logger.debug(f"Saved to cache: {cache_file}")
+                        saved = self._write_cached_page(cache_file, content)
+                        self._write_page_meta(cache_file, response.headers)
+                        logger.debug("Saved to cache: %s", saved)
                     except Exception as e:
                         logger.warning(f"Error saving cache: {e}")
 
-                return BeautifulSoup(content, 'lxml')
+                self._remember_page(cache_key, content)
+                return content
             else:
                 logger.warning(f"Failed to fetch {url}")
                 return None
@@ -132,6 +337,164 @@ class BaseScraper(ABC):
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+    @staticmethod
+    def _find_cached_page(cache_file: str) -> Optional[str]:
+        """
+        Locate the on-disk cache entry for a page, if any.
+
+        Checks compressed variants first, then the legacy uncompressed
+        file from older runs.
+
+        Args:
+            cache_file: Uncompressed cache path ({key}.html)
+
+        Returns:
+            Existing cache file path or None
+        """
+        for candidate in (cache_file + '.zst', cache_file + '.gz', cache_file):
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def _read_cached_page(path: str) -> bytes:
+        """
+        Read page bytes from a cache file, decompressing as needed.
+
+        Args:
+            path: Cache file path (.zst, .gz or plain .html)
+
+        Returns:
+            Raw HTML bytes
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if path.endswith('.zst'):
+            return _PAGE_DECOMPRESSOR.decompress(data)
+        if path.endswith('.gz'):
+            return gzip.decompress(data)
+        return data
+
+    @staticmethod
+    def _write_page_meta(cache_file: str, response_headers) -> None:
+        """
+        Store cache validators (ETag / Last-Modified) next to a page.
+
+        Only written when the server sent at least one validator; the
+        sidecar is what later turns an expired entry into a conditional
+        GET instead of a full refetch.
+
+        Args:
+            cache_file: Uncompressed cache path ({key}.html)
+            response_headers: Response header mapping
+        """
+        meta = {}
+        etag = response_headers.get('ETag')
+        if etag:
+            meta['etag'] = etag
+        last_modified = response_headers.get('Last-Modified')
+        if last_modified:
+            meta['last_modified'] = last_modified
+        if not meta:
+            return
+        with open(cache_file + '.meta.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    @staticmethod
+    def _conditional_headers(cache_file: str) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers for a cached page.
+
+        Args:
+            cache_file: Uncompressed cache path ({key}.html)
+
+        Returns:
+            Conditional request headers (empty when no validators stored)
+        """
+        try:
+            with open(cache_file + '.meta.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    @staticmethod
+    def _write_cached_page(cache_file: str, content: bytes) -> str:
+        """
+        Write page bytes to the disk cache, compressed.
+
+        zstd level 3 when available, otherwise gzip level 1 - both fast
+        enough that the write cost stays dwarfed by the network fetch
+        that precedes it.
+
+        Args:
+            cache_file: Uncompressed cache path ({key}.html)
+            content: Raw HTML bytes
+
+        Returns:
+            Path actually written
+        """
+        if zstandard is not None:
+            path = cache_file + '.zst'
+            data = _PAGE_COMPRESSOR.compress(content)
+        else:
+            path = cache_file + '.gz'
+            data = gzip.compress(content, compresslevel=1)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def _page_ttl_seconds(self, url: str) -> Optional[float]:
+        """
+        Disk-cache TTL for a page URL; None means the entry never expires.
+
+        Subclasses override to give different page types different
+        freshness bounds (list pages churn, detail pages barely change).
+
+        Args:
+            url: Page URL
+
+        Returns:
+            TTL in seconds or None
+        """
+        return None
+
+    def _remember_page(self, cache_key: str, content: bytes):
+        """
+        Store page bytes in the bounded in-process LRU.
+
+        Args:
+            cache_key: Hashed URL key
+            content: Raw HTML bytes
+        """
+        with self._page_cache_lock:
+            cache = self._page_memory_cache
+            cache[cache_key] = content
+            cache.move_to_end(cache_key)
+            while len(cache) > self.PAGE_CACHE_MAX:
+                cache.popitem(last=False)
+
+    def fetch_page(self, url: str, cache_key: Optional[str] = None) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a page, with optional caching.
+
+        Args:
+            url: URL to fetch
+            cache_key: Optional cache key (if not provided, uses URL hash)
+
+        Returns:
+            BeautifulSoup object or None if fetch failed
+        """
+        content = self.fetch_page_content(url, cache_key)
+        if content is None:
+            return None
+        return BeautifulSoup(content, 'lxml')
+
     def get_cached_listing(self, listing_id: str) -> Optional[Dict[str, Any]]:
         """
         Get cached listing data if available.
@@ -147,7 +510,7 @@ class BaseScraper(ABC):
 
         cached = self.cache_manager.get_latest_listing(self.source, self.category, listing_id)
         if cached:
-            logger.debug(f"Found cached listing {listing_id}")
+            logger.debug("Found cached listing %s", listing_id)
             return cached.get('data')
         return None
 
@@ -177,7 +540,7 @@ class BaseScraper(ABC):
             if change_info['changed']:
                 logger.info(f"Listing {listing_id} changed: {list(change_info['differences'].keys())}")
         else:
-            logger.debug(f"New listing for cache: {listing_id}")
+            logger.debug("New listing for cache: %s", listing_id)
 
         # Save to cache
         result = self.cache_manager.save_listing(
@@ -185,6 +548,47 @@ class BaseScraper(ABC):
         )
         return result is not None
 
+    def _scrape_detail_safe(self, listing_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one detail page, swallowing per-listing errors.
+
+        Args:
+            listing_url: URL of the listing detail page
+
+        Returns:
+            Detail data dictionary or None
+        """
+        try:
+            return self.scrape_detail_page(listing_url)
+        except Exception as e:
+            logger.error(f"Error fetching detail page {listing_url}: {e}")
+            return None
+
+    def scrape_detail_pages(self, urls: List[str], max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch detail pages for many listings, preserving input order.
+
+        The default implementation maps scrape_detail_page over a thread
+        pool (the work is network-bound); subclasses may override with an
+        async HTTP client.
+
+        Args:
+            urls: Listing detail URLs
+            max_workers: Thread count for concurrent fetches
+
+        Returns:
+            List of detail data dictionaries (None for failed fetches),
+            aligned with urls
+        """
+        if not urls:
+            return []
+
+        if len(urls) == 1 or max_workers <= 1:
+            return [self._scrape_detail_safe(url) for url in urls]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._scrape_detail_safe, urls))
+
     def fetch_or_get_from_cache(self, listing_url: str, listing_id: str, force_fetch: bool = False) -> Optional[Dict[str, Any]]:
         """
         Fetch listing detail page or retrieve from cache.
@@ -201,11 +605,11 @@ class BaseScraper(ABC):
         if not force_fetch:
             cached_data = self.get_cached_listing(listing_id)
             if cached_data:
-                logger.debug(f"Using cached data for listing {listing_id}")
+                logger.debug("Using cached data for listing %s", listing_id)
                 return cached_data
 
         # Fetch from web
-        logger.debug(f"Fetching listing {listing_id} from web")
+        logger.debug("Fetching listing %s from web", listing_id)
         detail_data = self.scrape_detail_page(listing_url)
 
         if detail_data:
@@ -215,21 +619,20 @@ class BaseScraper(ABC):
 
         return None
 
-    def run(self) -> List[Dict[str, Any]]:
+    def iter_run(self):
         """
-        Run the scraper for configured number of pages.
+        Yield listings page by page as they are parsed.
 
-        In 'new' mode, stops when encountering listings older than days_back.
-        In 'full' mode, scrapes all max_pages.
+        Streaming counterpart of run(): a consumer can start working on
+        (e.g. fetch details for) the first listings while later pages are
+        still being scraped. Mode handling matches run().
 
-        Returns:
-            List of all scraped listings
+        Yields:
+            Listing records (slotted Listing objects or dicts, depending
+            on what the subclass's iter_list_page produces) in scrape order
         """
-        all_listings = []
         cutoff_date = None
 
-        logger.info(f"Starting scraper: {self.name} (mode: {self.mode})")
-
         if self.mode == 'new':
             cutoff_date = datetime.now() - timedelta(days=self.days_back)
             logger.info(f"Only processing listings from last {self.days_back} days (since {cutoff_date.strftime('%Y-%m-%d')})")
@@ -238,46 +641,85 @@ class BaseScraper(ABC):
             logger.info(f"Scraping page {page_num + 1}/{self.max_pages}")
 
             try:
-                listings = self.scrape_list_page(page_num)
-
-                if not listings:
-                    logger.info(f"No listings found on page {page_num + 1}, stopping")
-                    break
-
-                logger.info(f"Found {len(listings)} listings on page {page_num + 1}")
-
-                # In 'new' mode, filter by date and stop if all listings are too old
+                # In 'new' mode, stream the page: old listings are
+                # skipped individually (pinned/promoted entries can sit
+                # above newer ones, so one old listing proves nothing)
+                # and the crawl stops only when a whole page yields no
+                # recent listing
                 if self.mode == 'new' and cutoff_date:
-                    recent_listings = []
-                    all_too_old = True
-
-                    for listing in listings:
+                    found_any = False
+                    found_recent = False
+
+                    for listing in self.iter_list_page(page_num):
+                        found_any = True
+                        # posted_date is datetime-or-None by construction
+                        # (see _parse_list_item), so the cutoff check is a
+                        # single rich comparison per listing
                         posted_date = listing.get('posted_date')
-                        if posted_date and isinstance(posted_date, datetime):
-                            if posted_date >= cutoff_date:
-                                recent_listings.append(listing)
-                                all_too_old = False
-                            else:
+                        if posted_date is not None and posted_date < cutoff_date:
+                            if logger.isEnabledFor(logging.DEBUG):
                                 logger.debug(f"Listing {listing.get('external_id')} too old: {posted_date.strftime('%Y-%m-%d')}")
-                        else:
-                            # If no date, include it (don't want to miss anything)
-                            recent_listings.append(listing)
-                            all_too_old = False
+                            continue
+                        # Undated listings are included (don't want to miss anything)
+                        found_recent = True
+                        yield listing
 
-                    all_listings.extend(recent_listings)
-                    logger.info(f"  {len(recent_listings)}/{len(listings)} listings are recent enough")
+                    if not found_any:
+                        logger.info(f"No listings found on page {page_num + 1}, stopping")
+                        break
 
-                    # Stop if all listings on this page are too old
-                    if all_too_old:
-                        logger.info(f"All listings on page {page_num + 1} are older than {self.days_back} days, stopping")
+                    if not found_recent:
+                        logger.info(f"All listings on page {page_num + 1} older than {self.days_back} days, stopping")
                         break
                 else:
-                    # Full mode - add all listings
-                    all_listings.extend(listings)
+                    # Full mode - yield all listings
+                    listings = list(self.iter_list_page(page_num))
+
+                    if not listings:
+                        logger.info(f"No listings found on page {page_num + 1}, stopping")
+                        break
+
+                    logger.info(f"Found {len(listings)} listings on page {page_num + 1}")
+                    yield from listings
 
             except Exception as e:
                 logger.error(f"Error scraping page {page_num + 1}: {e}")
                 continue
 
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Run the scraper for configured number of pages.
+
+        In 'new' mode, stops when encountering listings older than days_back.
+        In 'full' mode, scrapes all max_pages.
+
+        Returns:
+            List of all scraped listings
+        """
+        logger.info(f"Starting scraper: {self.name} (mode: {self.mode})")
+        all_listings = [
+            listing.asdict() if isinstance(listing, Listing) else listing
+            for listing in self.iter_run()
+        ]
         logger.info(f"Scraper {self.name} completed: {len(all_listings)} total listings")
         return all_listings
+
+    def run_with_details(self, max_workers: int = 8) -> List[tuple]:
+        """
+        Scrape list pages and fetch detail pages for every listing.
+
+        The default runs the two phases back to back; subclasses can
+        override to overlap them.
+
+        Args:
+            max_workers: Concurrency bound for detail fetches
+
+        Returns:
+            List of (listing, detail_data) pairs in scrape order, with
+            detail_data None for failed fetches
+        """
+        listings = self.run()
+        details = self.scrape_detail_pages(
+            [listing.get('url') for listing in listings], max_workers
+        )
+        return list(zip(listings, details))
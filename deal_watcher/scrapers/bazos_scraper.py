@@ -1,21 +1,232 @@
 """Common scraper logic for Bazos.sk website."""
 
+import asyncio
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 from datetime import datetime
 
-from deal_watcher.scrapers.base_scraper import BaseScraper
+from lxml import etree
+from lxml import html as lxml_html
+
+# selectolax (lexbor/myhtml C parser) handles the simple CSS lookups on
+# detail pages several times faster than lxml; fall back to the raw
+# lxml path when it is not installed.
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+# aiohttp overlaps the per-request round trips when fetching many detail
+# pages; without it the thread-pool path in BaseScraper is used instead.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from deal_watcher.scrapers.base_scraper import BaseScraper, Listing, _url_cache_key
 from deal_watcher.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class _AsyncHostRateLimiter:
+    """
+    Per-host politeness pacing for the aiohttp detail fetchers.
+
+    Mirrors the downloader's _HostRateLimiter: request starts on the
+    same host are spaced delay seconds apart, matching the spacing
+    HTTPClient enforces on every sync fetch. Cache hits never reach the
+    limiter, so they pay no delay. Safe without a lock because the
+    bookkeeping between await points runs atomically on the event loop.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_start: Dict[str, float] = {}
+
+    async def wait(self, netloc: str):
+        """
+        Sleep until this host's next allowed request slot.
+
+        Args:
+            netloc: Host portion of the URL being fetched
+        """
+        now = time.monotonic()
+        start = max(now, self._next_start.get(netloc, 0.0))
+        self._next_start[netloc] = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+# Posted date appears as "[14.11. 2025]" in listing text (module level so
+# the process-pool parse function below can reach it)
+_DATE_RE = re.compile(r'\[(\d{2}\.\d{2}\.\s*\d{4})\]')
+
+def _parse_bazos_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a Bazos date token ("DD.MM. YYYY") into a datetime.
+
+    strptime takes the _strptime cache lock and runs a generated regex
+    on every call; _DATE_RE already guarantees the digit layout, so
+    three int conversions do the same job lock-free.
+
+    Args:
+        date_str: Matched date text, e.g. "14.11. 2025"
+
+    Returns:
+        datetime or None for out-of-range values
+    """
+    try:
+        return datetime(int(date_str[-4:]), int(date_str[3:5]), int(date_str[:2]))
+    except ValueError:
+        return None
+
+
+class _PriceTranslate(dict):
+    """
+    str.translate table that deletes every character it does not know.
+
+    Lets one C-level translate pass keep digits, turn the decimal comma
+    into a dot and drop everything else (spaces, currency signs, text)
+    without enumerating the whole character set up front.
+    """
+
+    def __missing__(self, key):
+        return None
+
+
+def _fast_urljoin(base_url: str, rel: str) -> str:
+    """
+    Resolve an href/src against the site base without urlparse.
+
+    Bazos links are either absolute-path ('/inzerat/123/...') or already
+    full URLs, so string concatenation covers the hot loop; anything with
+    a query, fragment or dot-segments falls back to urljoin, which does
+    full RFC 3986 resolution.
+
+    Args:
+        base_url: Scheme+host base URL without a trailing slash
+        rel: href/src attribute value from the page
+
+    Returns:
+        Absolute URL
+    """
+    if not rel:
+        return base_url
+    if rel.startswith(('http://', 'https://')):
+        return rel
+    if rel.startswith('/') and '?' not in rel and '#' not in rel and '..' not in rel:
+        return base_url + rel
+    return urljoin(base_url, rel)
+
+
+def _parse_detail_bytes(content: Optional[bytes], base_url: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse detail page bytes with selectolax.
+
+    Module-level (not a method) so it pickles cleanly across the process
+    pool used for large batches; only the extracted dict crosses the
+    process boundary, never a parse tree.
+
+    Args:
+        content: Raw HTML bytes of the detail page (None passes through)
+        base_url: Base URL for resolving relative image links
+
+    Returns:
+        Dictionary with detailed information or None
+    """
+    if not content:
+        return None
+
+    try:
+        tree = SelectolaxParser(content)
+
+        # Extract full description
+        description_node = tree.css_first('div.popisdetail')
+        description = description_node.text(strip=True) if description_node else ''
+
+        # Extract all images
+        images = []
+        for img in tree.css('div.carousel-item img'):
+            src = img.attributes.get('src')
+            if src:
+                images.append(_fast_urljoin(base_url, src))
+
+        # Extract metadata (contact info, etc.). The posted date is NOT
+        # re-extracted here: the list page already provides it, and
+        # finding it again would mean flattening the whole document text
+        extra_data = {}
+
+        return {
+            'description': description,
+            'images': images,
+            'extra_data': extra_data
+        }
+
+    except Exception as e:
+        logger.error(f"Error parsing detail page: {e}")
+        return None
+
+
 class BazosScraper(BaseScraper):
     """Common scraper for Bazos.sk website."""
 
     LISTINGS_PER_PAGE = 20
 
+    # Precompiled XPaths for the list page - raw lxml traversal skips the
+    # per-element BeautifulSoup Tag wrappers on the hottest parse path.
+    # Class tests are token-exact (like BS4's class_=) so 'inzeraty' does
+    # not also match 'inzeratycena'; string(...) collapses text in C.
+    _CLS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')".format
+    _XP_ITEMS = etree.XPath(f"//div[{_CLS('inzeraty')}]")
+    _XP_TITLE_LINK = etree.XPath(f".//h2[{_CLS('nadpis')}]/a")
+    _XP_PRICE = etree.XPath(f"string(.//div[{_CLS('inzeratycena')}])")
+    _XP_LOCATION = etree.XPath(f"string(.//div[{_CLS('inzeratylok')}])")
+    _XP_VIEW = etree.XPath(f"string(.//div[{_CLS('inzeratyview')}])")
+    _XP_DESCRIPTION = etree.XPath(f"string(.//div[{_CLS('popis')}])")
+    _XP_IMG_SRC = etree.XPath(".//img/@src")
+    _XP_TEXT = etree.XPath("string(.)")
+    # The posted date lives in the small velikost10 span; targeting it
+    # avoids flattening the whole listing item just to find the token
+    _XP_DATE_SPAN = etree.XPath(f"string(.//span[{_CLS('velikost10')}])")
+    # Detail-page lookups for the lxml fallback parse path
+    _XP_DETAIL_DESCRIPTION = etree.XPath(f"string(//div[{_CLS('popisdetail')}])")
+    _XP_DETAIL_IMG_SRC = etree.XPath(f"//div[{_CLS('carousel-item')}]//img/@src")
+    del _CLS
+
+    # Posted date appears as "[14.11. 2025]" in the listing text
+    DATE_PATTERN = _DATE_RE
+
+    # Batches at least this large parse across a process pool; below it
+    # the pool spawn cost outweighs the parallel parse win
+    PROCESS_PARSE_MIN = 64
+
+    # Disk-cache TTLs per page type: the first list page picks up new
+    # listings within minutes, deeper offsets churn slowly, and detail
+    # pages are near-immutable once published
+    TTL_FIRST_PAGE = 5 * 60
+    TTL_LIST_PAGE = 6 * 3600
+    TTL_DETAIL_PAGE = 30 * 24 * 3600
+
+    # Remaining patterns used per listing, compiled once at class scope
+    # so the parse loops skip re's per-call cache lookup
+    _RE_BASE_URL = re.compile(r'(https?://[^/]+)')
+    _RE_LISTING_ID = re.compile(r'/inzerat/(\d+)/')
+    _RE_VIEW_COUNT = re.compile(r'(\d+)\s*x')
+    _RE_PER_M2 = re.compile(r'/m[²2]|€/m|eur/m|za m[²2]')
+
+    # Price parsing fast paths: a literal vocabulary for the no-price
+    # cases and a one-pass translate table for the numeric cleanup
+    _PRICE_SKIP = frozenset({'dohodou', 'v texte', 'v text'})
+    _PRICE_TABLE = _PriceTranslate(
+        {**{ord(c): c for c in '0123456789.'}, ord(','): '.'}
+    )
+    _RE_POSTAL_CODE = re.compile(r'(\d{3}\s?\d{2})$')
+
     def __init__(self, config: Dict[str, Any], http_client, cache_manager=None):
         """Initialize Bazos scraper."""
         super().__init__(config, http_client, cache_manager)
@@ -23,7 +234,7 @@ class BazosScraper(BaseScraper):
 
     def _extract_base_url(self, url: str) -> str:
         """Extract base URL from full URL."""
-        match = re.match(r'(https?://[^/]+)', url)
+        match = self._RE_BASE_URL.match(url)
         return match.group(1) if match else url
 
     def get_page_url(self, page_number: int) -> str:
@@ -55,68 +266,77 @@ class BazosScraper(BaseScraper):
             Listing ID or None
         """
         # Pattern: /inzerat/{ID}/
-        match = re.search(r'/inzerat/(\d+)/', url)
+        match = self._RE_LISTING_ID.search(url)
         if match:
             return match.group(1)
         return None
 
-    def scrape_list_page(self, page_number: int = 0) -> List[Dict[str, Any]]:
+    def iter_list_page(self, page_number: int = 0):
         """
-        Scrape a list page from Bazos.
+        Yield listings from a Bazos list page one at a time.
+
+        The DOM itself is built in one cheap C call; what this defers is
+        the Python-level field extraction per item, so a caller that
+        stops early (e.g. 'new' mode hitting the date cutoff) skips the
+        parse work for the rest of the page.
 
         Args:
             page_number: Page number (0-indexed)
 
-        Returns:
-            List of basic listing information
+        Yields:
+            Listing records in page order
         """
         url = self.get_page_url(page_number)
-        soup = self.fetch_page(url)
+        content = self.fetch_page_content(url)
 
-        if not soup:
-            return []
+        if not content:
+            return
 
-        listings = []
+        tree = lxml_html.fromstring(content)
 
-        # Find all listing containers
         # Bazos uses <div class="inzeraty"> for each listing
-        listing_divs = soup.find_all('div', class_='inzeraty')
-
-        for listing_div in listing_divs:
+        for listing_div in self._XP_ITEMS(tree):
             try:
                 listing_data = self._parse_list_item(listing_div)
-                if listing_data:
-                    listings.append(listing_data)
             except Exception as e:
                 logger.warning(f"Error parsing listing: {e}")
                 continue
+            if listing_data:
+                yield listing_data
+
+    def scrape_list_page(self, page_number: int = 0) -> List[Dict[str, Any]]:
+        """
+        Scrape a list page from Bazos.
+
+        Args:
+            page_number: Page number (0-indexed)
 
-        return listings
+        Returns:
+            List of basic listing dictionaries
+        """
+        return [listing.asdict() for listing in self.iter_list_page(page_number)]
 
-    def _parse_list_item(self, listing_div) -> Optional[Dict[str, Any]]:
+    def _parse_list_item(self, listing_div) -> Optional[Listing]:
         """
         Parse a single listing from list page.
 
         Args:
-            listing_div: BeautifulSoup div element
+            listing_div: lxml element for one <div class="inzeraty">
 
         Returns:
-            Dictionary with listing data or None
+            Slotted Listing record or None
         """
         try:
             # Find title and URL
             # Title is in <h2 class="nadpis"><a href="...">Title</a></h2>
-            title_h2 = listing_div.find('h2', class_='nadpis')
-            if not title_h2:
-                return None
-
-            title_link = title_h2.find('a')
-            if not title_link:
+            title_links = self._XP_TITLE_LINK(listing_div)
+            if not title_links:
                 return None
 
-            title = title_link.get_text(strip=True)
+            title_link = title_links[0]
+            title = title_link.text_content().strip()
             relative_url = title_link.get('href', '')
-            full_url = urljoin(self.base_url, relative_url)
+            full_url = _fast_urljoin(self.base_url, relative_url)
 
             # Extract listing ID
             listing_id = self.extract_listing_id(full_url)
@@ -124,60 +344,55 @@ class BazosScraper(BaseScraper):
                 return None
 
             # Extract price
-            price_text = listing_div.find('div', class_='inzeratycena')
             price = None
+            price_text = self._XP_PRICE(listing_div).strip()
             if price_text:
-                price = self._parse_price(price_text.get_text(strip=True))
+                price = self._parse_price(price_text)
 
             # Extract location
-            location_div = listing_div.find('div', class_='inzeratylok')
             location = None
             postal_code = None
-            if location_div:
-                location_text = location_div.get_text(strip=True)
+            location_text = self._XP_LOCATION(listing_div).strip()
+            if location_text:
                 location, postal_code = self._parse_location(location_text)
 
             # Extract view count
             view_count = None
-            view_div = listing_div.find('div', class_='inzeratyview')
-            if view_div:
-                view_match = re.search(r'(\d+)\s*x', view_div.get_text())
+            view_text = self._XP_VIEW(listing_div)
+            if view_text:
+                view_match = self._RE_VIEW_COUNT.search(view_text)
                 if view_match:
                     view_count = int(view_match.group(1))
 
             # Extract description
-            description_div = listing_div.find('div', class_='popis')
-            description = description_div.get_text(strip=True) if description_div else ''
+            description = self._XP_DESCRIPTION(listing_div).strip()
 
             # Extract image URL
             image_url = None
-            img_tag = listing_div.find('img')
-            if img_tag and img_tag.get('src'):
-                image_url = urljoin(self.base_url, img_tag.get('src'))
+            img_srcs = self._XP_IMG_SRC(listing_div)
+            if img_srcs:
+                image_url = _fast_urljoin(self.base_url, img_srcs[0])
 
-            # Extract posted date from listing (format: [14.11. 2025])
+            # Extract posted date from listing (format: [14.11. 2025]);
+            # fall back to the whole item text if the span moves
             posted_date = None
-            date_pattern = re.compile(r'\[(\d{2}\.\d{2}\.\s*\d{4})\]')
-            date_match = listing_div.find(string=date_pattern)
+            date_text = self._XP_DATE_SPAN(listing_div) or self._XP_TEXT(listing_div)
+            date_match = self.DATE_PATTERN.search(date_text)
             if date_match:
-                date_str = date_pattern.search(str(date_match)).group(1)
-                try:
-                    posted_date = datetime.strptime(date_str.strip(), '%d.%m. %Y')
-                except ValueError:
-                    pass
-
-            return {
-                'external_id': listing_id,
-                'title': title,
-                'url': full_url,
-                'price': price,
-                'location': location,
-                'postal_code': postal_code,
-                'view_count': view_count,
-                'description': description,
-                'image_url': image_url,
-                'posted_date': posted_date
-            }
+                posted_date = _parse_bazos_date(date_match.group(1).strip())
+
+            return Listing(
+                external_id=listing_id,
+                title=title,
+                url=full_url,
+                price=price,
+                location=location,
+                postal_code=postal_code,
+                view_count=view_count,
+                description=description,
+                image_url=image_url,
+                posted_date=posted_date
+            )
 
         except Exception as e:
             logger.error(f"Error parsing list item: {e}")
@@ -194,25 +409,27 @@ class BazosScraper(BaseScraper):
             Price as float or None (returns None for "per m²" prices)
         """
         # Handle special cases
-        if not price_text or price_text.lower() in ['dohodou', 'v texte', 'v text']:
+        if not price_text:
+            return None
+        lowered = price_text.casefold()
+        if lowered in self._PRICE_SKIP:
             return None
 
-        # Reject "price per m²" listings
-        price_lower = price_text.lower()
-        if any(per_unit in price_lower for per_unit in ['/m²', '/m2', '€/m', 'eur/m', 'za m²', 'za m2']):
-            logger.debug(f"Rejecting price-per-m² listing: {price_text}")
+        # Reject "price per m²" listings; the cheap membership pre-check
+        # skips the regex for the overwhelming majority of plain prices
+        if ('/' in lowered or 'za m' in lowered) and self._RE_PER_M2.search(lowered):
+            logger.debug("Rejecting price-per-m² listing: %s", price_text)
             return None
 
-        # Remove spaces, non-numeric characters except digits and decimal point
-        cleaned = re.sub(r'[^\d,.]', '', price_text)
-        # Replace comma with dot
-        cleaned = cleaned.replace(',', '.')
+        # One translate pass keeps digits, maps the decimal comma to a
+        # dot and drops everything else (spaces, currency signs)
+        cleaned = price_text.translate(self._PRICE_TABLE)
 
         try:
             price = float(cleaned)
             # Sanity check - if price is suspiciously low (< 100 EUR), might be per m²
             if price < 100:
-                logger.debug(f"Suspiciously low price ({price}), might be per m²: {price_text}")
+                logger.debug("Suspiciously low price (%s), might be per m²: %s", price, price_text)
                 return None
             return price
         except ValueError:
@@ -229,7 +446,7 @@ class BazosScraper(BaseScraper):
             Tuple of (location, postal_code)
         """
         # Try to extract postal code (usually 3-5 digits, optionally with space)
-        postal_match = re.search(r'(\d{3}\s?\d{2})$', location_text)
+        postal_match = self._RE_POSTAL_CODE.search(location_text)
 
         if postal_match:
             postal_code = postal_match.group(1).strip()
@@ -238,42 +455,31 @@ class BazosScraper(BaseScraper):
 
         return location_text.strip(), None
 
-    def _parse_detail_page_from_soup(self, soup) -> Optional[Dict[str, Any]]:
+    def _parse_detail_page_from_tree(self, tree) -> Optional[Dict[str, Any]]:
         """
-        Parse detail page from BeautifulSoup object.
+        Parse detail page from a raw lxml tree.
+
+        Used where selectolax is not installed (e.g. the processor's
+        fallback read path); the compiled XPaths resolve in C without
+        building a Python object per node.
 
         Args:
-            soup: BeautifulSoup object of detail page
+            tree: lxml element for the detail page document
 
         Returns:
             Dictionary with detailed information or None
         """
         try:
-            # Extract full description
-            description_div = soup.find('div', class_='popisdetail')
-            description = description_div.get_text(strip=True) if description_div else ''
+            description = self._XP_DETAIL_DESCRIPTION(tree).strip()
 
-            # Extract all images
             images = []
-            img_divs = soup.find_all('div', class_='carousel-item')
-            for img_div in img_divs:
-                img_tag = img_div.find('img')
-                if img_tag and img_tag.get('src'):
-                    img_url = urljoin(self.base_url, img_tag.get('src'))
-                    images.append(img_url)
-
-            # Extract metadata (posted date, contact info, etc.)
-            extra_data = {}
+            for src in self._XP_DETAIL_IMG_SRC(tree):
+                if src:
+                    images.append(_fast_urljoin(self.base_url, src))
 
-            # Try to find date posted
-            date_pattern = re.compile(r'\[(\d{2}\.\d{2}\.\s*\d{4})\]')
-            date_match = soup.find(string=date_pattern)
-            if date_match:
-                date_str = date_pattern.search(str(date_match)).group(1)
-                try:
-                    extra_data['posted_date'] = datetime.strptime(date_str.strip(), '%d.%m. %Y').isoformat()
-                except ValueError:
-                    pass
+            # Extract metadata (contact info, etc.). The posted date is
+            # NOT re-extracted here: the list page already provides it
+            extra_data = {}
 
             return {
                 'description': description,
@@ -285,6 +491,296 @@ class BazosScraper(BaseScraper):
             logger.error(f"Error parsing detail page: {e}")
             return None
 
+    def _parse_detail_page_fast(self, content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Parse detail page bytes with selectolax.
+
+        Same fields as _parse_detail_page_from_tree, but the detail page
+        only needs a handful of CSS lookups, which the lexbor C parser
+        resolves without building a Python Tag tree.
+
+        Args:
+            content: Raw HTML bytes of the detail page
+
+        Returns:
+            Dictionary with detailed information or None
+        """
+        return _parse_detail_bytes(content, self.base_url)
+
+    def _page_ttl_seconds(self, url: str) -> Optional[float]:
+        """
+        Disk-cache TTL for a Bazos page URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            TTL in seconds
+        """
+        if '/inzerat/' in url:
+            return self.TTL_DETAIL_PAGE
+        if url == self.url:
+            return self.TTL_FIRST_PAGE
+        return self.TTL_LIST_PAGE
+
+    def _parse_detail_content(self, content: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Parse detail page bytes with the best available parser.
+
+        Args:
+            content: Raw HTML bytes of the detail page
+
+        Returns:
+            Dictionary with detailed information or None
+        """
+        if SelectolaxParser is not None:
+            return self._parse_detail_page_fast(content)
+        return self._parse_detail_page_from_tree(lxml_html.fromstring(content))
+
+    def scrape_detail_pages(self, urls: List[str], max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch detail pages concurrently, preserving input order.
+
+        Uses aiohttp with a bounded semaphore and a shared keep-alive
+        connection pool when available; otherwise falls back to the
+        thread-pool implementation in BaseScraper.
+
+        Args:
+            urls: Listing detail URLs
+            max_workers: Concurrency bound for simultaneous fetches
+
+        Returns:
+            List of detail data dictionaries (None for failures)
+        """
+        if aiohttp is None or not urls:
+            return super().scrape_detail_pages(urls, max_workers)
+
+        return asyncio.run(self._scrape_detail_pages_async(urls, max_workers))
+
+    async def _fetch_detail_async(
+        self,
+        session,
+        url: str,
+        limiter: _AsyncHostRateLimiter,
+        semaphore: asyncio.Semaphore,
+        headers: Dict[str, str]
+    ) -> Optional[bytes]:
+        """
+        Fetch one detail page through the page cache and rate limiter.
+
+        Async counterpart of fetch_page_content: fresh cache entries
+        (memory LRU, then disk) are served without touching the network
+        or paying the politeness delay; misses and expired entries go
+        through the per-host limiter, with expired copies revalidated
+        by conditional GET and fetched bytes written back to the cache.
+
+        Args:
+            session: Shared aiohttp ClientSession
+            url: Listing detail URL
+            limiter: Per-host politeness limiter
+            semaphore: Concurrency bound for simultaneous requests
+            headers: Base request headers (User-Agent)
+
+        Returns:
+            Raw HTML bytes or None if fetch failed
+        """
+        if not url:
+            return None
+
+        cache_key = _url_cache_key(url)
+        cache_file = os.path.join(self.cache_dir, f"{cache_key}.html")
+
+        with self._page_cache_lock:
+            cached = self._page_memory_cache.get(cache_key)
+            if cached is not None:
+                self._page_memory_cache.move_to_end(cache_key)
+                return cached
+
+        conditional_headers = None
+        existing = self._find_cached_page(cache_file) if self.cache_pages else None
+        if existing is not None:
+            ttl = self._page_ttl_seconds(url)
+            expired = False
+            if ttl is not None:
+                try:
+                    expired = (time.time() - os.path.getmtime(existing)) > ttl
+                except OSError:
+                    expired = True
+            if expired:
+                logger.debug("Cache entry expired (ttl %ss): %s", ttl, existing)
+                conditional_headers = self._conditional_headers(cache_file) or None
+            else:
+                try:
+                    logger.debug("Loading from cache: %s", existing)
+                    content = await asyncio.to_thread(self._read_cached_page, existing)
+                    self._remember_page(cache_key, content)
+                    return content
+                except Exception as e:
+                    logger.warning(f"Error loading cache {existing}: {e}")
+
+        request_headers = headers
+        if conditional_headers:
+            request_headers = {**headers, **conditional_headers}
+
+        async with semaphore:
+            await limiter.wait(urlsplit(url).netloc)
+            try:
+                async with session.get(url, headers=request_headers) as response:
+                    if response.status == 304 and existing is not None:
+                        # Server confirms the expired copy is still
+                        # current: reuse it and restart the TTL clock
+                        logger.debug("Not modified, revalidated cache: %s", existing)
+                        content = await asyncio.to_thread(self._read_cached_page, existing)
+                        os.utime(existing, None)
+                        self._remember_page(cache_key, content)
+                        return content
+                    if response.status != 200:
+                        logger.warning(f"Failed to fetch {url}: HTTP {response.status}")
+                        return None
+                    content = await response.read()
+                    response_headers = response.headers
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+
+        if self.cache_pages:
+            try:
+                await asyncio.to_thread(self._write_cached_page, cache_file, content)
+                self._write_page_meta(cache_file, response_headers)
+            except Exception as e:
+                logger.warning(f"Error saving cache: {e}")
+
+        self._remember_page(cache_key, content)
+        return content
+
+    async def _scrape_detail_pages_async(self, urls: List[str], concurrency: int) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch and parse detail pages with aiohttp and bounded concurrency.
+
+        Fetches go through the disk page cache and a per-host rate
+        limiter honoring the configured request delay, so this path is
+        no less polite (and no less cache-friendly) than the sync one.
+
+        Args:
+            urls: Listing detail URLs
+            concurrency: Maximum simultaneous requests
+
+        Returns:
+            List of detail data dictionaries aligned with urls
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = _AsyncHostRateLimiter(self.http_client.request_delay)
+        timeout = aiohttp.ClientTimeout(total=self.http_client.timeout)
+        connector = aiohttp.TCPConnector(
+            limit=concurrency, limit_per_host=concurrency, keepalive_timeout=30
+        )
+        headers = {'User-Agent': self.http_client._get_random_user_agent()}
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            pages = await asyncio.gather(*(
+                self._fetch_detail_async(session, url, limiter, semaphore, headers)
+                for url in urls
+            ))
+
+        # Large batches parse across a process pool (only the extracted
+        # dicts cross the process boundary); small ones parse inline
+        if (SelectolaxParser is not None
+                and len(urls) >= self.PROCESS_PARSE_MIN
+                and (os.cpu_count() or 1) > 1):
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(
+                    partial(_parse_detail_bytes, base_url=self.base_url), pages
+                ))
+
+        return [self._parse_detail_content(page) if page else None for page in pages]
+
+    def run_with_details(self, max_workers: int = 8) -> List[tuple]:
+        """
+        Scrape list pages and detail pages as one fused pipeline.
+
+        With aiohttp available, detail fetches start as soon as each
+        listing comes off a list page, so detail latency hides behind the
+        next list-page fetch instead of running as a separate phase.
+        Falls back to the sequential two-phase base implementation.
+
+        Args:
+            max_workers: Concurrency bound for detail fetches
+
+        Returns:
+            List of (listing, detail_data) pairs in scrape order
+        """
+        if aiohttp is None:
+            return super().run_with_details(max_workers)
+
+        return asyncio.run(self._run_pipeline_async(max_workers))
+
+    async def _run_pipeline_async(self, concurrency: int) -> List[tuple]:
+        """
+        Producer/consumer pipeline: list-page iteration feeds a queue
+        drained by concurrent detail fetchers.
+
+        The (blocking, rate-limited) list-page iteration runs in a worker
+        thread; each parsed listing is enqueued immediately and detail
+        workers fetch over a shared keep-alive session, going through
+        the page cache and a per-host rate limiter honoring the
+        configured request delay. Parsing runs in the executor so it
+        never stalls the other fetchers on the event loop.
+
+        Args:
+            concurrency: Number of detail-fetch workers
+
+        Returns:
+            List of (listing, detail_data) pairs in scrape order
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        results: Dict[int, tuple] = {}
+
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = _AsyncHostRateLimiter(self.http_client.request_delay)
+        timeout = aiohttp.ClientTimeout(total=self.http_client.timeout)
+        connector = aiohttp.TCPConnector(
+            limit=concurrency, limit_per_host=concurrency, keepalive_timeout=30
+        )
+        headers = {'User-Agent': self.http_client._get_random_user_agent()}
+
+        def produce():
+            # Runs in a thread: iter_run blocks on the rate-limited
+            # list-page fetches while detail workers drain the queue
+            count = 0
+            for listing in self.iter_run():
+                loop.call_soon_threadsafe(queue.put_nowait, (count, listing))
+                count += 1
+            for _ in range(concurrency):
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        async def worker(session):
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                seq, listing = item
+                content = await self._fetch_detail_async(
+                    session, listing.get('url'), limiter, semaphore, headers
+                )
+                if content:
+                    # Parse off the loop: a synchronous parse here would
+                    # stall every other fetcher for its duration
+                    detail = await loop.run_in_executor(
+                        None, self._parse_detail_content, content
+                    )
+                else:
+                    detail = None
+                record = listing.asdict() if isinstance(listing, Listing) else listing
+                results[seq] = (record, detail)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            workers = [asyncio.create_task(worker(session)) for _ in range(concurrency)]
+            await loop.run_in_executor(None, produce)
+            await asyncio.gather(*workers)
+
+        return [results[seq] for seq in sorted(results)]
+
     def scrape_detail_page(self, listing_url: str) -> Optional[Dict[str, Any]]:
         """
         Scrape detail page for a listing.
@@ -295,9 +791,9 @@ class BazosScraper(BaseScraper):
         Returns:
             Dictionary with detailed information or None
         """
-        soup = self.fetch_page(listing_url)
+        content = self.fetch_page_content(listing_url)
 
-        if not soup:
+        if not content:
             return None
 
-        return self._parse_detail_page_from_soup(soup)
+        return self._parse_detail_content(content)
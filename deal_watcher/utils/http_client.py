@@ -1,7 +1,8 @@
 """HTTP client with retry logic and rate limiting."""
 
+import itertools
 import time
-import random
+import threading
 from typing import Optional, Dict, Any
 import requests
 from requests.adapters import HTTPAdapter
@@ -9,6 +10,17 @@ from urllib3.util.retry import Retry
 
 from deal_watcher.utils.logger import get_logger
 
+# Brotli-compressed HTML is ~20% smaller on the wire than gzip; only
+# advertise it when a decoder urllib3 recognizes is actually installed,
+# otherwise responses would arrive undecodable
+try:
+    import brotlicffi as brotli
+except ImportError:
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
 logger = get_logger(__name__)
 
 
@@ -41,7 +53,22 @@ class HTTPClient:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
             '(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
         ]
-        self.last_request_time = 0
+        # Next allowed request start on the monotonic clock; monotonic
+        # time cannot jump backwards (NTP sync, DST) the way wall-clock
+        # time.time() can, which would otherwise stretch or skip delays
+        self._next_allowed = 0.0
+        # Serializes the delay bookkeeping so concurrent callers (e.g.
+        # the detail-fetch thread pool) still respect the per-host rate
+        self._rate_limit_lock = threading.Lock()
+        # With a single user agent there is nothing to rotate, so the
+        # per-request header dict can be built once up front
+        self._static_headers = (
+            {'User-Agent': self.user_agents[0]} if len(self.user_agents) == 1 else None
+        )
+        # Round-robin rotation: next() on a cycle is cheaper than
+        # random.choice per request, and even coverage of the agent list
+        # is all the rotation needs to achieve
+        self._ua_cycle = itertools.cycle(self.user_agents)
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
@@ -61,36 +88,61 @@ class HTTPClient:
             allowed_methods=["GET", "POST"]
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Persistent keep-alive pools amortize TCP+TLS setup across the
+        # whole run: pool_connections covers one pool per Bazos subdomain
+        # when the downloader crosses categories, pool_maxsize leaves
+        # headroom for the concurrent detail-fetch workers, and
+        # pool_block=False means a saturated pool opens an extra
+        # connection instead of stalling a worker
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=16,
+            pool_maxsize=32,
+            pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
+        # Static headers live on the session; only the rotated User-Agent
+        # is set per request
+        session.headers.update({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'sk,en-US;q=0.7,en;q=0.3',
+            'Accept-Encoding': 'gzip, deflate, br' if brotli is not None else 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        })
+
         return session
 
     def _get_random_user_agent(self) -> str:
         """
-        Get random user agent from the list.
+        Get the next user agent in the rotation.
 
         Returns:
-            Random user agent string
+            User agent string
         """
-        return random.choice(self.user_agents)
+        return next(self._ua_cycle)
 
     def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            sleep_time = self.request_delay - elapsed
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Enforce rate limiting between requests (thread-safe)."""
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            if now < self._next_allowed:
+                sleep_time = self._next_allowed - now
+                # Lazy %-formatting: the message is only rendered when a
+                # handler actually accepts DEBUG records
+                logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
+                time.sleep(sleep_time)
+            self._next_allowed = time.monotonic() + self.request_delay
 
     def get(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        skip_rate_limit: bool = False
+        skip_rate_limit: bool = False,
+        stream: bool = False
     ) -> Optional[requests.Response]:
         """
         Perform GET request with retry logic.
@@ -100,6 +152,8 @@ class HTTPClient:
             params: Query parameters
             headers: Additional headers
             skip_rate_limit: Skip rate limiting for this request
+            stream: Defer body download so the caller can pipe
+                response.raw straight to disk
 
         Returns:
             Response object or None if request failed
@@ -107,29 +161,25 @@ class HTTPClient:
         if not skip_rate_limit:
             self._rate_limit()
 
-        # Prepare headers
-        request_headers = {
-            'User-Agent': self._get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'sk,en-US;q=0.7,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-
-        if headers:
-            request_headers.update(headers)
+        # Prepare headers (static ones are set on the session)
+        if self._static_headers is not None and not headers:
+            request_headers = self._static_headers
+        else:
+            request_headers = {'User-Agent': self._get_random_user_agent()}
+            if headers:
+                request_headers.update(headers)
 
         try:
-            logger.debug(f"GET request: {url}")
+            logger.debug("GET request: %s", url)
             response = self.session.get(
                 url,
                 params=params,
                 headers=request_headers,
-                timeout=self.timeout
+                timeout=self.timeout,
+                stream=stream
             )
             response.raise_for_status()
-            logger.debug(f"Response status: {response.status_code}")
+            logger.debug("Response status: %s", response.status_code)
             return response
 
         except requests.exceptions.HTTPError as e:
@@ -145,6 +195,46 @@ class HTTPClient:
             logger.error(f"Request error for {url}: {e}")
             return None
 
+    def head(
+        self,
+        url: str,
+        skip_rate_limit: bool = False
+    ) -> Optional[requests.Response]:
+        """
+        Perform HEAD request without following redirects.
+
+        A HEAD costs ~100 bytes on the wire versus tens of kilobytes for
+        a GET body, so callers can use it to probe whether a page is
+        worth fetching (Bazos redirects past-the-end list pages back to
+        page 0, which shows up here as a 3xx status).
+
+        Args:
+            url: URL to request
+            skip_rate_limit: Skip rate limiting for this request
+
+        Returns:
+            Response object or None if request failed
+        """
+        if not skip_rate_limit:
+            self._rate_limit()
+
+        if self._static_headers is not None:
+            request_headers = self._static_headers
+        else:
+            request_headers = {'User-Agent': self._get_random_user_agent()}
+
+        try:
+            logger.debug("HEAD request: %s", url)
+            return self.session.head(
+                url,
+                headers=request_headers,
+                timeout=self.timeout,
+                allow_redirects=False
+            )
+        except requests.exceptions.RequestException as e:
+            logger.error(f"HEAD request error for {url}: {e}")
+            return None
+
     def close(self):
         """Close the HTTP session."""
         self.session.close()
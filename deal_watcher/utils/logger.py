@@ -19,15 +19,26 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
 
+    # Colored level names built once at class creation; per record this
+    # is a dict lookup instead of three string concatenations
+    _COLORED_LEVELS = {
+        level: f"{color}{level}\033[0m"
+        for level, color in COLORS.items() if level != 'RESET'
+    }
+
     def format(self, record):
         """Format log record with colors."""
-        log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset_color = self.COLORS['RESET']
-
-        # Add color to the level name
-        record.levelname = f"{log_color}{record.levelname}{reset_color}"
-
-        return super().format(record)
+        original_levelname = record.levelname
+        record.levelname = self._COLORED_LEVELS.get(
+            original_levelname, original_levelname
+        )
+        try:
+            return super().format(record)
+        finally:
+            # The record is shared with any other handlers attached to
+            # the logger (e.g. the plain file handler); restore the
+            # levelname so they don't see the ANSI codes
+            record.levelname = original_levelname
 
 
 def setup_logger(
@@ -1,7 +1,20 @@
 """Debug script to inspect Bazos.sk HTML structure."""
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+# Token-exact class test, same predicate the scraper uses; the pattern
+# queries are compiled once at import instead of re-parsed per call
+_CLS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')".format
+_PATTERNS = [
+    ('div', 'inzerat', etree.XPath(f"//div[{_CLS('inzerat')}]")),
+    ('div', 'inzeraty', etree.XPath(f"//div[{_CLS('inzeraty')}]")),
+    ('div', 'inzeratycena', etree.XPath(f"//div[{_CLS('inzeratycena')}]")),
+    ('table', None, etree.XPath('//table')),
+    ('tr', None, etree.XPath('//tr')),
+]
+_XP_INZERAT_LINKS = etree.XPath('//a[contains(@href, "/inzerat/")]')
 
 def inspect_bazos():
     """Fetch and inspect Bazos.sk page structure."""
@@ -15,49 +28,41 @@ def inspect_bazos():
     response = requests.get(url, headers=headers)
     print(f"Status: {response.status_code}")
 
-    soup = BeautifulSoup(response.content, 'lxml')
+    # Raw lxml tree - no BS4 wrapper layer on top of the C parse
+    tree = lxml_html.fromstring(response.content)
 
     # Look for different possible listing containers
     print("\n=== Searching for listing containers ===")
 
     # Try common patterns
-    patterns = [
-        ('div', {'class': 'inzerat'}),
-        ('div', {'class': 'inzeraty'}),
-        ('div', {'class': 'inzeratycena'}),
-        ('table', {}),
-        ('tr', {}),
-    ]
-
-    for tag, attrs in patterns:
-        elements = soup.find_all(tag, attrs)
+    for tag, class_name, query in _PATTERNS:
+        elements = query(tree)
         if elements:
-            print(f"\nFound {len(elements)} <{tag}> elements with {attrs}")
-            if len(elements) > 0:
-                print("First element HTML (truncated to 500 chars):")
-                print(str(elements[0])[:500])
+            print(f"\nFound {len(elements)} <{tag}> elements with class={class_name}")
+            print("First element HTML (truncated to 500 chars):")
+            print(etree.tostring(elements[0], encoding='unicode')[:500])
 
-    # Look for links to listings
+    # Look for links to listings (single XPath instead of filtering all <a>)
     print("\n=== Looking for listing links ===")
-    links = soup.find_all('a', href=True)
-    inzerat_links = [a for a in links if '/inzerat/' in a.get('href', '')]
+    inzerat_links = _XP_INZERAT_LINKS(tree)
     print(f"Found {len(inzerat_links)} links to /inzerat/")
 
     if inzerat_links:
+        first = inzerat_links[0]
         print("\nFirst listing link:")
-        print(f"  href: {inzerat_links[0].get('href')}")
-        print(f"  text: {inzerat_links[0].get_text(strip=True)[:100]}")
-        print(f"  Full HTML: {str(inzerat_links[0])[:300]}")
+        print(f"  href: {first.get('href')}")
+        print(f"  text: {first.text_content().strip()[:100]}")
+        print(f"  Full HTML: {etree.tostring(first, encoding='unicode')[:300]}")
 
         # Check parent structure
-        parent = inzerat_links[0].parent
-        print(f"\nParent tag: {parent.name}")
+        parent = first.getparent()
+        print(f"\nParent tag: {parent.tag}")
         print(f"Parent classes: {parent.get('class')}")
-        print(f"Parent HTML (truncated): {str(parent)[:500]}")
+        print(f"Parent HTML (truncated): {etree.tostring(parent, encoding='unicode')[:500]}")
 
     # Save full HTML for inspection
     with open('/tmp/bazos_debug.html', 'w', encoding='utf-8') as f:
-        f.write(soup.prettify())
+        f.write(etree.tostring(tree, pretty_print=True, encoding='unicode'))
     print("\n\nFull HTML saved to /tmp/bazos_debug.html")
 
 if __name__ == '__main__':
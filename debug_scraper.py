@@ -6,12 +6,22 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from collections import Counter
+
+from lxml import etree
+from lxml import html as lxml_html
+
 from deal_watcher.utils.http_client import HTTPClient
 from deal_watcher.utils.logger import setup_logger
-from bs4 import BeautifulSoup
 
 logger = setup_logger('debug', level='DEBUG')
 
+# Precompiled queries - compiled once at import instead of re-parsed on
+# every call
+_XP_TABLES = etree.XPath('//table')
+_XP_CLASSED = etree.XPath('//*[@class]')
+_XP_INZERAT_LINKS = etree.XPath('//a[contains(@href, "/inzerat/")]')
+
 def debug_bazos_html():
     """Fetch Bazos.sk and analyze HTML structure."""
 
@@ -29,28 +39,31 @@ def debug_bazos_html():
     logger.info(f"Got response: {response.status_code}")
     logger.info(f"Content length: {len(response.content)} bytes")
 
-    soup = BeautifulSoup(response.content, 'lxml')
+    # Raw lxml tree - no BS4 wrapper layer on top of the C parse
+    tree = lxml_html.fromstring(response.content)
 
     # Save full HTML
     with open('/tmp/bazos_full.html', 'w', encoding='utf-8') as f:
-        f.write(soup.prettify())
+        f.write(etree.tostring(tree, pretty_print=True, encoding='unicode'))
     logger.info("Saved full HTML to /tmp/bazos_full.html")
 
     # Look for different patterns
     logger.info("\n=== Analyzing structure ===")
 
     # Check for tables (common in older Slovak sites)
-    tables = soup.find_all('table')
+    tables = _XP_TABLES(tree)
     logger.info(f"Found {len(tables)} tables")
 
-    # Check for common div classes
+    # Check for common div classes: one tree walk tallies every class
+    # token instead of a separate traversal per class name
+    class_counts = Counter()
+    for element in _XP_CLASSED(tree):
+        class_counts.update(element.get('class').split())
     for class_name in ['inzerat', 'inzeraty', 'inzeratycena', 'nadpis', 'popis']:
-        divs = soup.find_all(attrs={'class': class_name})
-        logger.info(f"Found {len(divs)} elements with class='{class_name}'")
+        logger.info(f"Found {class_counts[class_name]} elements with class='{class_name}'")
 
-    # Look for links to /inzerat/
-    all_links = soup.find_all('a', href=True)
-    inzerat_links = [a for a in all_links if '/inzerat/' in a.get('href', '')]
+    # Look for links to /inzerat/ (single XPath instead of filtering all <a>)
+    inzerat_links = _XP_INZERAT_LINKS(tree)
     logger.info(f"\nFound {len(inzerat_links)} links to /inzerat/")
 
     if inzerat_links:
@@ -58,16 +71,16 @@ def debug_bazos_html():
         for i, link in enumerate(inzerat_links[:3]):
             logger.info(f"\n  Link {i+1}:")
             logger.info(f"    href: {link.get('href')}")
-            logger.info(f"    text: {link.get_text(strip=True)[:60]}")
+            logger.info(f"    text: {link.text_content().strip()[:60]}")
             logger.info(f"    classes: {link.get('class')}")
 
             # Check parent
-            parent = link.parent
-            logger.info(f"    parent: <{parent.name}> with classes: {parent.get('class')}")
+            parent = link.getparent()
+            logger.info(f"    parent: <{parent.tag}> with classes: {parent.get('class')}")
 
             # Check for nearby price/location
-            if parent:
-                siblings = list(parent.next_siblings)
+            if parent is not None:
+                siblings = list(parent.itersiblings())
                 logger.info(f"    parent has {len(siblings)} next siblings")
 
     http_client.close()
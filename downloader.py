@@ -7,21 +7,107 @@ This script:
 3. Downloads and caches each listing's detail page as separate HTML file
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import os
+import random
 import sys
 import json
 import re
+import shutil
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Set
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from typing import Dict, Any, List, Optional, Set
+from urllib.parse import urljoin, urlsplit
+from lxml import etree
+from lxml import html as lxml_html
+
+# aiohttp lets categories download concurrently (each host still paced
+# by its own politeness delay); without it the serial HTTPClient loop
+# below is used instead.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# orjson serializes/parses JSON in C; fall back to the stdlib when not
+# installed. The index format is identical either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bazos pages are repetitive markup that compresses ~10x; with zstandard
+# installed listings are cached as .html.zst (same dependency the other
+# caches use), otherwise as plain .html.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+if zstandard is not None:
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+
+# selectolax's Lexbor engine parses list pages several times faster than
+# libxml2; the compiled-XPath lxml path below remains as the fallback.
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
 
 from deal_watcher.utils.logger import setup_logger, get_logger
 from deal_watcher.utils.http_client import HTTPClient
 
 logger = None
 
+_DEFAULT_USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+]
+
+# Token-exact class predicate, same shape the scrapers use; the listing
+# link query is compiled once at import instead of re-parsed per page
+_CLS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')".format
+_XP_LISTING_HREFS = etree.XPath(
+    f"//div[{_CLS('inzeraty')}]//h2[{_CLS('nadpis')}]/a/@href"
+)
+
+# Hot-loop regexes compiled once at import instead of going through the
+# re module cache on every call
+_ID_RE = re.compile(r'/inzerat/(\d+)/')
+_BASE_RE = re.compile(r'(https?://[^/]+)')
+
+
+class _HostRateLimiter:
+    """
+    Per-host politeness pacing for the async downloader.
+
+    Request starts on the same host are spaced request_delay apart, but
+    different hosts (auto.bazos.sk vs reality.bazos.sk) proceed
+    independently - that is where the concurrency win comes from. Safe
+    without a lock because the bookkeeping between await points runs
+    atomically on the event loop.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_start: Dict[str, float] = {}
+
+    async def wait(self, netloc: str):
+        """
+        Sleep until this host's next allowed request slot.
+
+        Args:
+            netloc: Host portion of the URL being fetched
+        """
+        now = time.monotonic()
+        start = max(now, self._next_start.get(netloc, 0.0))
+        self._next_start[netloc] = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
 
 def load_download_config(config_path: str = 'download_config.json') -> Dict[str, Any]:
     """
@@ -34,12 +120,14 @@ def load_download_config(config_path: str = 'download_config.json') -> Dict[str,
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
+        # Covers both json.JSONDecodeError and orjson.JSONDecodeError
         logger.error(f"Error parsing configuration file: {e}")
         sys.exit(1)
 
@@ -65,7 +153,7 @@ def get_page_url(base_url: str, page_number: int) -> str:
 
 def extract_base_url(url: str) -> str:
     """Extract base URL from full URL."""
-    match = re.match(r'(https?://[^/]+)', url)
+    match = _BASE_RE.match(url)
     return match.group(1) if match else url
 
 
@@ -80,82 +168,360 @@ def extract_listing_urls_from_page(html_content: bytes, base_url: str) -> List[D
     Returns:
         List of dicts with listing_id and url
     """
-    soup = BeautifulSoup(html_content, 'lxml')
     listings = []
 
-    # Find all listing containers
-    listing_divs = soup.find_all('div', class_='inzeraty')
+    if _SelectolaxParser is not None:
+        # Lexbor parses the raw bytes and runs the CSS selector without
+        # building a Python object per node
+        tree = _SelectolaxParser(html_content)
+        hrefs = (
+            a.attributes.get('href')
+            for a in tree.css('div.inzeraty h2.nadpis a')
+        )
+    else:
+        # Raw lxml tree + compiled XPath straight to the title hrefs -
+        # no BS4 wrapper layer on top of the C parse
+        tree = lxml_html.fromstring(html_content)
+        hrefs = _XP_LISTING_HREFS(tree)
+
+    for relative_url in hrefs:
+        if not relative_url:
+            continue
+        full_url = urljoin(base_url, relative_url)
 
-    for listing_div in listing_divs:
-        try:
-            # Find title and URL
-            title_h2 = listing_div.find('h2', class_='nadpis')
-            if not title_h2:
-                continue
+        # Extract listing ID from URL
+        # Pattern: /inzerat/123456789/title
+        match = _ID_RE.search(full_url)
+        if match:
+            listings.append({
+                'listing_id': match.group(1),
+                'url': full_url
+            })
 
-            title_link = title_h2.find('a')
-            if not title_link:
-                continue
+    return listings
 
-            relative_url = title_link.get('href', '')
-            full_url = urljoin(base_url, relative_url)
 
-            # Extract listing ID from URL
-            # Pattern: /inzerat/123456789/title
-            match = re.search(r'/inzerat/(\d+)/', full_url)
-            if match:
-                listing_id = match.group(1)
-                listings.append({
-                    'listing_id': listing_id,
-                    'url': full_url
-                })
+def _drop_from_page_cache(f) -> None:
+    """
+    Hint the kernel to evict a just-written cache file from RAM.
 
-        except Exception as e:
-            logger.warning(f"Error parsing listing: {e}")
-            continue
+    Downloaded HTML is read once by the processor on a later run, so
+    keeping it in the page cache only displaces hotter data.
+    sync_file_range kicks asynchronous writeback without the full device
+    flush an fsync would cost per file (the durability barrier happens
+    once per category in _sync_cache_dir instead); POSIX_FADV_DONTNEED
+    then drops whatever pages are already clean. No-op where
+    posix_fadvise is unavailable.
 
-    return listings
+    Args:
+        f: Open binary file object that was just written
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        f.flush()
+        fd = f.fileno()
+        if hasattr(os, 'sync_file_range'):
+            os.sync_file_range(fd, 0, 0, os.SYNC_FILE_RANGE_WRITE)
+        else:
+            os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+def _sync_cache_dir(cache_dir: Path) -> None:
+    """
+    Durability barrier for a category: one fsync on the directory.
+
+    Per-file writes only kick asynchronous writeback (see
+    _drop_from_page_cache); this single flush at the end of the category
+    makes the new filenames and their data durable at the cost of one
+    device flush instead of one per page.
+
+    Args:
+        cache_dir: Cache directory for this URL category
+    """
+    try:
+        dir_fd = os.open(cache_dir, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
 
 
 def save_listing_to_cache(
     cache_dir: Path,
     listing_id: str,
     url: str,
-    content: bytes
-) -> Path:
+    content: bytes,
+    index_fp,
+    seen_hashes: Set[str],
+    response_headers: Optional[Dict[str, str]] = None,
+    downloaded_at: Optional[str] = None
+) -> Optional[Path]:
     """
     Save individual listing HTML to cache directory.
 
+    Bodies whose content hash was already recorded in the index (error
+    or "no results" pages served under many listing IDs) skip the disk
+    write entirely.
+
     Args:
         cache_dir: Cache directory for this URL category
         listing_id: Listing ID
         url: URL that was fetched
         content: Raw HTML content
+        index_fp: Open append handle for the category's index.jsonl
+        seen_hashes: Content hashes already cached for this category
+        response_headers: Optional response headers; ETag / Last-Modified
+            are recorded so later runs can issue conditional GETs
+        downloaded_at: Optional batch timestamp shared by the whole
+            category run; computed per call when omitted
 
     Returns:
-        Path to saved file
+        Path to saved file, or None when the body was a duplicate
     """
-    # Create filename: {listing_id}.html
-    filename = f"{listing_id}.html"
-    filepath = cache_dir / filename
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    if content_hash in seen_hashes:
+        logger.debug("Duplicate content for %s, skipping write", listing_id)
+        return None
+    seen_hashes.add(content_hash)
+
+    # Save HTML, compressed when zstandard is available
+    if zstandard is not None:
+        filepath = cache_dir / f"{listing_id}.html.zst"
+        payload = _ZSTD_COMPRESSOR.compress(content)
+    else:
+        filepath = cache_dir / f"{listing_id}.html"
+        payload = content
 
-    # Save HTML
     with open(filepath, 'wb') as f:
-        f.write(content)
+        f.write(payload)
+        _drop_from_page_cache(f)
+
+    _write_listing_meta(
+        index_fp, listing_id, url, len(content), response_headers,
+        content_hash=content_hash, downloaded_at=downloaded_at
+    )
+
+    return filepath
+
+
+def stream_listing_to_cache(
+    cache_dir: Path,
+    listing_id: str,
+    url: str,
+    response,
+    index_fp,
+    seen_hashes: Set[str],
+    downloaded_at: Optional[str] = None
+) -> tuple:
+    """
+    Stream a listing response body straight to its cache file.
+
+    Pipes response.raw to disk in 64 KB chunks instead of materializing
+    the whole body in memory first, so peak memory per in-flight page
+    stays at one buffer regardless of page size. The content hash is
+    computed on the chunks as they pass through; a body that turns out
+    to be a duplicate has its file removed again (the write cost is paid
+    once, but the cache and index stay free of copies).
+
+    Args:
+        cache_dir: Cache directory for this URL category
+        listing_id: Listing ID
+        url: URL that was fetched
+        response: Streaming requests Response (from get(..., stream=True))
+        index_fp: Open append handle for the category's index.jsonl
+        seen_hashes: Content hashes already cached for this category
+        downloaded_at: Optional batch timestamp shared by the whole
+            category run; computed per call when omitted
+
+    Returns:
+        (path to saved file or None when duplicate, bytes written)
+    """
+    if zstandard is not None:
+        filepath = cache_dir / f"{listing_id}.html.zst"
+    else:
+        filepath = cache_dir / f"{listing_id}.html"
+
+    size = 0
+    hasher = hashlib.blake2b(digest_size=16)
+    try:
+        # decode_content makes urllib3 gunzip on the fly, so the cache
+        # file holds the same plain HTML as the buffered path
+        response.raw.decode_content = True
+        with open(filepath, 'wb') as f:
+            if zstandard is not None:
+                with _ZSTD_COMPRESSOR.stream_writer(f, closefd=False) as writer:
+                    size = _copy_counted(response.raw, writer, hasher=hasher)
+            else:
+                size = _copy_counted(response.raw, f, hasher=hasher)
+            _drop_from_page_cache(f)
+    finally:
+        response.close()
+
+    content_hash = hasher.hexdigest()
+    if content_hash in seen_hashes:
+        logger.debug("Duplicate content for %s, removing", listing_id)
+        filepath.unlink()
+        return None, size
+    seen_hashes.add(content_hash)
+
+    _write_listing_meta(
+        index_fp, listing_id, url, size, response.headers,
+        content_hash=content_hash, downloaded_at=downloaded_at
+    )
+
+    return filepath, size
+
+
+def _copy_counted(src, dst, chunk_size: int = 65536, hasher=None) -> int:
+    """
+    Pipe src to dst in chunks, returning the byte count.
+
+    Like shutil.copyfileobj, but reports how many (uncompressed) bytes
+    passed through so stats and metadata stay in page bytes even when
+    dst is a compressing writer, and optionally feeds the chunks through
+    a hash object on the way.
+
+    Args:
+        src: Readable binary stream
+        dst: Writable binary stream
+        chunk_size: Read size per iteration
+        hasher: Optional hash object updated with each chunk
+
+    Returns:
+        Total bytes copied
+    """
+    total = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        dst.write(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+        total += len(chunk)
+    return total
+
+
+def _is_cached(cache_dir: Path, listing_id: str) -> bool:
+    """
+    Check whether a listing already has a cache file.
+
+    One or two stat calls per candidate instead of enumerating the whole
+    directory up front; on a category whose cache holds thousands of
+    files but whose list pages only surface a few hundred candidates,
+    the per-candidate check does strictly less work.
 
-    # Save metadata
-    meta_filename = f"{listing_id}.meta.json"
-    meta_filepath = cache_dir / meta_filename
+    Args:
+        cache_dir: Cache directory for this URL category
+        listing_id: Listing ID
+
+    Returns:
+        True when a .html or .html.zst entry exists for the listing
+    """
+    base = os.path.join(os.fspath(cache_dir), listing_id)
+    return os.path.exists(base + '.html.zst') or os.path.exists(base + '.html')
+
+
+def load_seen_hashes(cache_dir: Path) -> Set[str]:
+    """
+    Load previously recorded content hashes from a category's index.
+
+    Used to short-circuit writes when a downloaded body is byte-for-byte
+    identical to one already cached (typically an error or "no results"
+    page served for many listings).
+
+    Args:
+        cache_dir: Cache directory for this URL category
+
+    Returns:
+        Set of blake2b hex digests
+    """
+    seen = set()
+    index_file = cache_dir / 'index.jsonl'
+    if index_file.exists():
+        with open(index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson is not None else json.loads(line)
+                except ValueError:
+                    continue
+                content_hash = record.get('content_hash')
+                if content_hash:
+                    seen.add(content_hash)
+    return seen
+
+
+def open_cache_index(cache_dir: Path):
+    """
+    Open a category's metadata index for appending.
+
+    One append-only index.jsonl per category replaces a .meta.json file
+    per listing: one inode and sequential writes instead of an
+    open/write/close cycle per download.
+
+    Args:
+        cache_dir: Cache directory for this URL category
+
+    Returns:
+        Open binary file handle
+    """
+    return open(cache_dir / 'index.jsonl', 'ab', buffering=1 << 20)
+
+
+def _write_listing_meta(
+    index_fp,
+    listing_id: str,
+    url: str,
+    content_length: int,
+    response_headers: Optional[Dict[str, str]] = None,
+    content_hash: Optional[str] = None,
+    downloaded_at: Optional[str] = None
+) -> None:
+    """
+    Append a cached listing's metadata line to the category index.
+
+    Args:
+        index_fp: Open append handle for the category's index.jsonl
+        listing_id: Listing ID
+        url: URL that was fetched
+        content_length: Size of the saved HTML in bytes
+        response_headers: Optional response headers; ETag / Last-Modified
+            are recorded so later runs can issue conditional GETs
+        content_hash: Optional blake2b hex digest of the body, used by
+            later runs to skip writing duplicate content
+        downloaded_at: Optional precomputed timestamp; one datetime.now()
+            per category batch replaces one per page
+    """
     metadata = {
         'listing_id': listing_id,
         'url': url,
-        'downloaded_at': datetime.now().isoformat(),
-        'content_length': len(content)
+        'downloaded_at': downloaded_at or datetime.now().isoformat(timespec='seconds'),
+        'content_length': content_length
     }
-    with open(meta_filepath, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2)
-
-    return filepath
+    if content_hash:
+        metadata['content_hash'] = content_hash
+    if response_headers:
+        etag = response_headers.get('ETag')
+        if etag:
+            metadata['etag'] = etag
+        last_modified = response_headers.get('Last-Modified')
+        if last_modified:
+            metadata['last_modified'] = last_modified
+    if orjson is not None:
+        index_fp.write(orjson.dumps(metadata) + b'\n')
+    else:
+        index_fp.write(json.dumps(metadata, separators=(',', ':')).encode('utf-8') + b'\n')
 
 
 def download_url_category(
@@ -190,14 +556,6 @@ def download_url_category(
     cache_dir.mkdir(parents=True, exist_ok=True)
     logger.info(f"Cache directory: {cache_dir}")
 
-    # Get already cached listing IDs (to avoid re-downloading)
-    cached_ids = set()
-    for html_file in cache_dir.glob('*.html'):
-        listing_id = html_file.stem
-        cached_ids.add(listing_id)
-
-    logger.info(f"Found {len(cached_ids)} already cached listings")
-
     stats = {
         'list_pages_fetched': 0,
         'listings_found': 0,
@@ -209,6 +567,10 @@ def download_url_category(
 
     base_domain = extract_base_url(base_url)
     all_listing_urls = []
+    # Listings shift between pages as new entries push pagination, so
+    # the same ID can surface on two pages within one crawl; dedupe at
+    # aggregation time instead of paying a redundant GET later
+    seen_ids: Set[str] = set()
 
     # Step 1: Fetch list pages and extract listing URLs
     logger.info("Step 1: Extracting listing URLs from list pages...")
@@ -217,6 +579,21 @@ def download_url_category(
         logger.info(f"Fetching list page {page_num + 1}/{max_pages}")
 
         try:
+            # Probe past-the-first pages with a cheap HEAD: Bazos
+            # redirects past-the-end pages back to page 0, so a 3xx
+            # status means the category is exhausted and the full body
+            # transfer can be skipped entirely. Anything else (405,
+            # anti-bot 403, transient 503) falls through to the normal
+            # GET, which logs and handles errors itself.
+            if page_num > 0:
+                head_response = http_client.head(url, skip_rate_limit=True)
+                if head_response is not None and 300 <= head_response.status_code < 400:
+                    logger.info(
+                        f"Page {page_num + 1} past end of category "
+                        f"(HTTP {head_response.status_code}), stopping"
+                    )
+                    break
+
             response = http_client.get(url)
             if response and response.status_code == 200:
                 content = response.content
@@ -226,7 +603,10 @@ def download_url_category(
                 listings = extract_listing_urls_from_page(content, base_domain)
                 logger.info(f"  Found {len(listings)} listings on page {page_num + 1}")
 
-                all_listing_urls.extend(listings)
+                for listing_info in listings:
+                    if listing_info['listing_id'] not in seen_ids:
+                        seen_ids.add(listing_info['listing_id'])
+                        all_listing_urls.append(listing_info)
 
                 if len(listings) == 0:
                     logger.warning(f"No listings on page {page_num + 1}, stopping")
@@ -246,38 +626,275 @@ def download_url_category(
 
     # Step 2: Download individual listing pages
     logger.info("\nStep 2: Downloading individual listing pages...")
-    for idx, listing_info in enumerate(all_listing_urls, 1):
-        listing_id = listing_info['listing_id']
-        listing_url = listing_info['url']
+    seen_hashes = load_seen_hashes(cache_dir)
+    # Second-resolution batch timestamp shared by every page in this
+    # category; per-page datetime.now() added nothing but allocations
+    batch_timestamp = datetime.now().isoformat(timespec='seconds')
+    index_fp = open_cache_index(cache_dir)
+    # A writer thread drains each response body to disk while the main
+    # thread is already sleeping out the politeness delay for the next
+    # request, so the write cost hides inside otherwise-idle time. One
+    # worker keeps the index appends and the dedup set serialized
+    # without extra locking.
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = []
+    try:
+        for idx, listing_info in enumerate(all_listing_urls, 1):
+            listing_id = listing_info['listing_id']
+            listing_url = listing_info['url']
+
+            # Skip if already cached
+            if _is_cached(cache_dir, listing_id):
+                stats['listings_skipped'] += 1
+                logger.debug("[%d/%d] Skipping cached: %s", idx, len(all_listing_urls), listing_id)
+                continue
 
-        # Skip if already cached
-        if listing_id in cached_ids:
-            stats['listings_skipped'] += 1
-            logger.debug(f"[{idx}/{len(all_listing_urls)}] Skipping cached: {listing_id}")
-            continue
+            logger.debug("[%d/%d] Downloading: %s", idx, len(all_listing_urls), listing_id)
+
+            try:
+                response = http_client.get(listing_url, stream=True)
+                if response and response.status_code == 200:
+                    # Stream the body straight to disk off-thread
+                    pending.append((listing_id, executor.submit(
+                        stream_listing_to_cache, cache_dir, listing_id,
+                        listing_url, response, index_fp, seen_hashes,
+                        batch_timestamp
+                    )))
+                else:
+                    logger.error("  ✗ Failed to download %s", listing_id)
+                    stats['listings_failed'] += 1
+
+            except Exception as e:
+                logger.error("Error downloading %s: %s", listing_id, e)
+                stats['listings_failed'] += 1
 
-        logger.info(f"[{idx}/{len(all_listing_urls)}] Downloading: {listing_id}")
+        # Drain the writer queue and surface any write failures
+        for listing_id, future in pending:
+            try:
+                filepath, size = future.result()
+            except Exception as e:
+                logger.error("Error saving %s: %s", listing_id, e)
+                stats['listings_failed'] += 1
+                continue
+            if filepath is None:
+                stats['listings_skipped'] += 1
+                logger.debug("  - Skipped %s (duplicate content)", listing_id)
+            else:
+                stats['listings_downloaded'] += 1
+                stats['total_bytes'] += size
+                logger.debug("  ✓ Saved %s (%d bytes)", listing_id, size)
+    finally:
+        executor.shutdown(wait=True)
+        index_fp.close()
+        _sync_cache_dir(cache_dir)
 
-        try:
-            response = http_client.get(listing_url)
-            if response and response.status_code == 200:
-                content = response.content
+    logger.info(f"\n{name} completed:")
+    logger.info(f"  - List pages fetched: {stats['list_pages_fetched']}")
+    logger.info(f"  - Listings found: {stats['listings_found']}")
+    logger.info(f"  - Listings downloaded: {stats['listings_downloaded']}")
+    logger.info(f"  - Listings skipped (cached): {stats['listings_skipped']}")
+    logger.info(f"  - Listings failed: {stats['listings_failed']}")
+    logger.info(f"  - Total size: {stats['total_bytes'] / 1024 / 1024:.2f} MB")
 
-                # Save to cache
-                filepath = save_listing_to_cache(cache_dir, listing_id, listing_url, content)
-                stats['listings_downloaded'] += 1
-                stats['total_bytes'] += len(content)
+    return stats
 
-                logger.info(f"  ✓ Saved {listing_id} ({len(content):,} bytes)")
 
-            else:
-                logger.error(f"  ✗ Failed to download {listing_id}")
-                stats['listings_failed'] += 1
+async def _fetch_async(
+    session,
+    limiter: _HostRateLimiter,
+    url: str,
+    user_agents: List[str]
+) -> Optional[bytes]:
+    """
+    Fetch one URL through the shared aiohttp session.
 
-        except Exception as e:
-            logger.error(f"Error downloading {listing_id}: {e}")
+    Args:
+        session: Shared aiohttp ClientSession
+        limiter: Per-host rate limiter
+        url: URL to fetch
+        user_agents: User agent strings to rotate
+
+    Returns:
+        Response bytes or None on failure
+    """
+    await limiter.wait(urlsplit(url).netloc)
+    headers = {'User-Agent': random.choice(user_agents)}
+    try:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 200:
+                return await response.read()
+            logger.error(f"Failed to fetch {url}: HTTP {response.status}")
+    except Exception as e:
+        logger.error(f"Error fetching {url}: {e}")
+    return None
+
+
+async def download_url_category_async(
+    url_config: Dict[str, Any],
+    session,
+    limiter: _HostRateLimiter,
+    user_agents: List[str],
+    base_cache_dir: Path,
+    sem: asyncio.BoundedSemaphore
+) -> Dict[str, int]:
+    """
+    Async counterpart of download_url_category.
+
+    List pages stay sequential within the category (the empty-page early
+    stop needs each page's result before fetching the next), but each
+    page's listing detail downloads are scheduled the moment the page is
+    parsed, so they overlap the remaining pagination instead of waiting
+    for it, and whole categories run side by side under one shared
+    session.
+
+    Args:
+        url_config: URL configuration (name, base_url, max_pages, cache_subdir)
+        session: Shared aiohttp ClientSession
+        limiter: Per-host rate limiter
+        user_agents: User agent strings to rotate
+        base_cache_dir: Base cache directory (e.g., cache/bazos)
+        sem: Semaphore capping in-flight detail downloads across all
+            categories
+
+    Returns:
+        Statistics dictionary
+    """
+    name = url_config['name']
+    base_url = url_config['base_url']
+    max_pages = url_config['max_pages']
+    cache_subdir = url_config['cache_subdir']
+
+    logger.info(f"=" * 60)
+    logger.info(f"Downloading: {name}")
+    logger.info(f"URL: {base_url}")
+    logger.info(f"Max pages: {max_pages}")
+    logger.info(f"=" * 60)
+
+    cache_dir = base_cache_dir / cache_subdir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Cache directory: {cache_dir}")
+
+    stats = {
+        'list_pages_fetched': 0,
+        'listings_found': 0,
+        'listings_downloaded': 0,
+        'listings_skipped': 0,
+        'listings_failed': 0,
+        'total_bytes': 0
+    }
+
+    base_domain = extract_base_url(base_url)
+
+    async def download_one(listing_info, index_fp, seen_hashes, batch_timestamp,
+                           writer):
+        listing_id = listing_info['listing_id']
+        listing_url = listing_info['url']
+        # The semaphore caps how many detail downloads are in flight at
+        # once; unbounded gathers against one host invite 429s and
+        # connection errors that cost more in retries than the
+        # concurrency buys
+        async with sem:
+            content = await _fetch_async(session, limiter, listing_url, user_agents)
+        if content:
+            # Compression and the disk write run on the single writer
+            # thread so they never stall the event loop; one worker also
+            # keeps the index appends and the dedup set serialized
+            filepath = await asyncio.get_running_loop().run_in_executor(
+                writer, lambda: save_listing_to_cache(
+                    cache_dir, listing_id, listing_url, content, index_fp,
+                    seen_hashes, downloaded_at=batch_timestamp
+                )
+            )
+            if filepath is None:
+                stats['listings_skipped'] += 1
+                logger.debug("  - Skipped %s (duplicate content)", listing_id)
+                return
+            stats['listings_downloaded'] += 1
+            stats['total_bytes'] += len(content)
+            logger.debug("  ✓ Saved %s (%d bytes)", listing_id, len(content))
+        else:
+            logger.error("  ✗ Failed to download %s", listing_id)
             stats['listings_failed'] += 1
 
+    seen_hashes = load_seen_hashes(cache_dir)
+    batch_timestamp = datetime.now().isoformat(timespec='seconds')
+    index_fp = open_cache_index(cache_dir)
+    writer = ThreadPoolExecutor(max_workers=1)
+    scheduled_ids: Set[str] = set()
+    detail_tasks = []
+
+    # Pagination and detail downloads run interleaved: each page's new
+    # listings are scheduled as soon as the page is parsed, so detail
+    # fetches fill the politeness gaps between list-page requests
+    # instead of waiting for the whole pagination phase to finish.
+    try:
+        logger.info("Extracting listing URLs and downloading listings...")
+        for page_num in range(max_pages):
+            url = get_page_url(base_url, page_num)
+            logger.info(f"Fetching list page {page_num + 1}/{max_pages}")
+
+            # Same cheap HEAD probe as the serial path: a 3xx status on
+            # a past-the-first page (Bazos redirects past-the-end pages
+            # back to page 0) means the category is exhausted; any
+            # other status falls through to the normal GET
+            if page_num > 0:
+                try:
+                    async with session.head(
+                        url,
+                        headers={'User-Agent': random.choice(user_agents)},
+                        allow_redirects=False
+                    ) as probe:
+                        if 300 <= probe.status < 400:
+                            logger.info(
+                                f"Page {page_num + 1} past end of category "
+                                f"(HTTP {probe.status}), stopping"
+                            )
+                            break
+                except Exception as e:
+                    logger.debug("HEAD probe failed for %s: %s", url, e)
+
+            content = await _fetch_async(session, limiter, url, user_agents)
+            if content:
+                stats['list_pages_fetched'] += 1
+                listings = extract_listing_urls_from_page(content, base_domain)
+                logger.info(f"  Found {len(listings)} listings on page {page_num + 1}")
+
+                stats['listings_found'] += len(listings)
+                for listing_info in listings:
+                    listing_id = listing_info['listing_id']
+                    if listing_id in scheduled_ids or _is_cached(cache_dir, listing_id):
+                        stats['listings_skipped'] += 1
+                        continue
+                    scheduled_ids.add(listing_id)
+                    detail_tasks.append(asyncio.ensure_future(download_one(
+                        listing_info, index_fp, seen_hashes, batch_timestamp,
+                        writer
+                    )))
+
+                if len(listings) == 0:
+                    logger.warning(f"No listings on page {page_num + 1}, stopping")
+                    break
+            else:
+                logger.error(f"  Failed to fetch page {page_num + 1}")
+                if page_num == 0:
+                    logger.error("Failed on first page, stopping this category")
+                    break
+
+        logger.info(f"\nFound {stats['listings_found']} total listings")
+        if detail_tasks:
+            await asyncio.gather(*detail_tasks)
+    finally:
+        # On an exceptional exit some detail tasks may still be running;
+        # settle them before the index handle they write to is closed
+        pending_tasks = [task for task in detail_tasks if not task.done()]
+        for task in pending_tasks:
+            task.cancel()
+        if pending_tasks:
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+        writer.shutdown(wait=True)
+        index_fp.close()
+        _sync_cache_dir(cache_dir)
+
     logger.info(f"\n{name} completed:")
     logger.info(f"  - List pages fetched: {stats['list_pages_fetched']}")
     logger.info(f"  - Listings found: {stats['listings_found']}")
@@ -289,6 +906,44 @@ def download_url_category(
     return stats
 
 
+async def _download_all_async(
+    url_configs: List[Dict[str, Any]],
+    download_settings: Dict[str, Any],
+    base_cache_dir: Path
+) -> List[Dict[str, int]]:
+    """
+    Download every URL category concurrently over one shared session.
+
+    Args:
+        url_configs: URL category configurations
+        download_settings: Download settings from config
+        base_cache_dir: Base cache directory
+
+    Returns:
+        Per-category statistics dictionaries
+    """
+    limiter = _HostRateLimiter(download_settings.get('request_delay_seconds', 2.5))
+    user_agents = download_settings.get('user_agents') or _DEFAULT_USER_AGENTS
+    timeout = aiohttp.ClientTimeout(total=download_settings.get('timeout_seconds', 30))
+    # Both knobs are tunable from download_config.json; the semaphore
+    # caps how many download coroutines run at once while the connector
+    # caps actual sockets per host
+    connector = aiohttp.TCPConnector(
+        limit=download_settings.get('max_connections', 64),
+        limit_per_host=download_settings.get('per_host_connections', 4),
+        keepalive_timeout=75
+    )
+    sem = asyncio.BoundedSemaphore(download_settings.get('concurrency', 16))
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return list(await asyncio.gather(*(
+            download_url_category_async(
+                url_config, session, limiter, user_agents, base_cache_dir, sem
+            )
+            for url_config in url_configs
+        )))
+
+
 def main():
     """Main entry point for downloader."""
     global logger
@@ -302,16 +957,7 @@ def main():
 
     # Load configuration
     config = load_download_config()
-
-    # Setup HTTP client
     download_settings = config.get('download_settings', {})
-    http_client = HTTPClient(
-        timeout=download_settings.get('timeout_seconds', 30),
-        max_retries=download_settings.get('max_retries', 3),
-        backoff_factor=download_settings.get('retry_backoff_factor', 2.0),
-        request_delay=download_settings.get('request_delay_seconds', 2.5),
-        user_agents=download_settings.get('user_agents', [])
-    )
 
     # Base cache directory
     base_cache_dir = Path('cache/bazos')
@@ -330,16 +976,32 @@ def main():
     url_configs = config.get('urls_to_download', [])
     logger.info(f"Found {len(url_configs)} URL categories to download\n")
 
-    for url_config in url_configs:
-        stats = download_url_category(url_config, http_client, base_cache_dir)
-
-        # Accumulate stats
+    if aiohttp is not None:
+        # Categories download concurrently; each host is still paced by
+        # request_delay, so total wall time approaches the slowest host
+        # instead of the sum of all of them
+        all_stats = asyncio.run(
+            _download_all_async(url_configs, download_settings, base_cache_dir)
+        )
+    else:
+        http_client = HTTPClient(
+            timeout=download_settings.get('timeout_seconds', 30),
+            max_retries=download_settings.get('max_retries', 3),
+            backoff_factor=download_settings.get('retry_backoff_factor', 2.0),
+            request_delay=download_settings.get('request_delay_seconds', 2.5),
+            user_agents=download_settings.get('user_agents', [])
+        )
+        all_stats = [
+            download_url_category(url_config, http_client, base_cache_dir)
+            for url_config in url_configs
+        ]
+        http_client.close()
+
+    # Accumulate stats
+    for stats in all_stats:
         for key in total_stats:
             total_stats[key] += stats.get(key, 0)
 
-    # Clean up
-    http_client.close()
-
     # Print summary
     logger.info("\n" + "=" * 60)
     logger.info("Download Complete")
@@ -5,17 +5,45 @@ This script processes previously downloaded HTML pages from the cache directory.
 It extracts listings, applies configured filters, and saves matches to the database.
 """
 
+import multiprocessing
 import os
 import sys
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, Any, Iterator, List, Optional
+from lxml import html as lxml_html
 from dotenv import load_dotenv
 
+# With selectolax available, cached pages are parsed by a process pool
+# using the same picklable parser the scrapers' batch pipeline uses;
+# without it the serial lxml path below still works.
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None
+
+# orjson decodes the config and index files several times faster than
+# stdlib json; both produce the same dicts, so it is a drop-in upgrade
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The downloader caches listings as .html.zst when zstandard is
+# installed; plain .html files from older runs are read either way.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+if zstandard is not None:
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
 from deal_watcher.utils.logger import setup_logger, get_logger
 from deal_watcher.database.repository import DealRepository
-from deal_watcher.scrapers.bazos_scraper import BazosScraper
+from deal_watcher.scrapers.bazos_scraper import BazosScraper, _parse_detail_bytes
 from deal_watcher.scrapers.auto_scraper import AutoScraper
 from deal_watcher.scrapers.reality_scraper import RealityScraper
 from deal_watcher.filters.auto_filter import AutoFilter
@@ -27,6 +55,15 @@ load_dotenv()
 
 logger = None
 
+# Fallback URL-to-cache mapping for configs without cache_subdir; adding
+# a source is one table row instead of another elif branch
+_URL_TO_CACHE = (
+    ('auto.bazos.sk/bmw', Path('cache/bazos/auto-bmw')),
+    ('reality.bazos.sk/predam/pozemok', Path('cache/bazos/reality-pozemok')),
+    ('reality.bazos.sk/predam/dom', Path('cache/bazos/reality-dom')),
+    ('reality.bazos.sk/predam/chata', Path('cache/bazos/reality-chata')),
+)
+
 
 def load_config(config_path: str = 'deal_watcher/config/config.json') -> Dict[str, Any]:
     """
@@ -39,8 +76,8 @@ def load_config(config_path: str = 'deal_watcher/config/config.json') -> Dict[st
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        raw = Path(config_path).read_bytes()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         # Replace environment variables in connection string
         db_config = config.get('database', {})
@@ -56,7 +93,7 @@ def load_config(config_path: str = 'deal_watcher/config/config.json') -> Dict[st
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.error(f"Error parsing configuration file: {e}")
         sys.exit(1)
 
@@ -71,69 +108,467 @@ def get_cache_directory_for_scraper(scraper_config: Dict[str, Any]) -> Path:
     Returns:
         Path to cache directory
     """
-    # Map scraper to cache subdirectory
-    # This maps the scraper configs to download_config.json cache_subdir values
+    # Scraper configs carry the same cache_subdir the downloader uses,
+    # so no URL pattern matching is needed and the two configs cannot
+    # drift apart silently
+    cache_subdir = scraper_config.get('cache_subdir')
+    if cache_subdir:
+        return Path('cache/bazos') / cache_subdir
+
+    # Fallback for older configs without cache_subdir
     url = scraper_config.get('url', '')
 
-    if 'auto.bazos.sk/bmw' in url:
-        return Path('cache/bazos/auto-bmw')
-    elif 'reality.bazos.sk/predam/pozemok' in url:
-        return Path('cache/bazos/reality-pozemok')
-    elif 'reality.bazos.sk/predam/dom' in url:
-        return Path('cache/bazos/reality-dom')
-    elif 'reality.bazos.sk/predam/chata' in url:
-        return Path('cache/bazos/reality-chata')
-    else:
+    cache_dir = next(
+        (path for substring, path in _URL_TO_CACHE if substring in url), None
+    )
+    if cache_dir is None:
         logger.warning(f"Unknown URL pattern: {url}")
-        return None
+    return cache_dir
+
+
+# A process pool only pays off once there are enough files to amortize
+# worker startup; smaller batches parse in-process
+_POOL_MIN_FILES = 50
+
+# Matched listings are written to the database in batches of this size,
+# one upsert round-trip per batch instead of one per deal
+_DB_BATCH_SIZE = 500
+
+# The serial fallback hands listings to the filter in batches of this
+# size via matches_batch, one call instead of one per listing
+_FILTER_BATCH_SIZE = 256
+
+# Version tag for parsed.jsonl records; bump when the detail-page
+# parsing logic changes so stale extractions are ignored
+_PARSED_CACHE_VERSION = 1
 
+# How many files ahead of the current one to hint the kernel to read;
+# the prefetch overlaps disk IO with the parse of the current file
+_PREFETCH_WINDOW = 16
 
-def read_cached_listings(cache_dir: Path) -> List[tuple]:
+
+def _advise_willneed(path: str) -> None:
     """
-    Read all cached individual listing HTML files from a directory.
+    Hint the kernel to start reading a cache file into the page cache.
+
+    No-op where posix_fadvise is unavailable; failures are ignored
+    because the subsequent read works either way, just colder.
+
+    Args:
+        path: File about to be read
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _load_index_metadata(cache_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load per-listing metadata from a category's index.jsonl.
+
+    The index is append-only (one compact line per download), so the
+    last line for a listing wins on re-downloads.
 
     Args:
         cache_dir: Directory containing cached listing HTML files
 
     Returns:
-        List of tuples (listing_id, BeautifulSoup, metadata)
+        Mapping of listing_id to its metadata record
     """
-    if not cache_dir.exists():
-        logger.warning(f"Cache directory does not exist: {cache_dir}")
-        return []
+    index_metadata = {}
+    index_file = cache_dir / 'index.jsonl'
+    if index_file.exists():
+        with open(index_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson is not None else json.loads(line)
+                except ValueError:
+                    continue
+                record_id = record.get('listing_id')
+                if record_id:
+                    index_metadata[record_id] = record
+    return index_metadata
 
-    listings = []
-    html_files = list(cache_dir.glob('*.html'))
 
-    logger.info(f"Found {len(html_files)} cached listings in {cache_dir}")
+def _load_parsed_cache(cache_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load previously extracted detail data from a category's parsed.jsonl.
 
-    for html_file in html_files:
-        try:
-            listing_id = html_file.stem
+    Each line records the content hash the extraction came from (the
+    same blake2b digest the downloader wrote to index.jsonl), so a
+    listing whose body has not changed since the last run skips the
+    HTML parse entirely. Append-only; the last line per listing wins.
+
+    Args:
+        cache_dir: Directory containing cached listing HTML files
+
+    Returns:
+        Mapping of listing_id to its parsed record
+    """
+    parsed_cache = {}
+    parsed_file = cache_dir / 'parsed.jsonl'
+    if parsed_file.exists():
+        with open(parsed_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson is not None else json.loads(line)
+                except ValueError:
+                    continue
+                if record.get('version') != _PARSED_CACHE_VERSION:
+                    continue
+                record_id = record.get('listing_id')
+                if record_id and record.get('content_hash') and 'detail' in record:
+                    parsed_cache[record_id] = record
+    return parsed_cache
 
-            # Read HTML
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                soup = BeautifulSoup(content, 'lxml')
 
-            # Read metadata if exists
-            meta_file = html_file.parent / f"{listing_id}.meta.json"
+def _append_parsed_cache(cache_dir: Path, records: List[Dict[str, Any]]) -> None:
+    """
+    Append freshly parsed detail records to the category's parsed.jsonl.
+
+    Args:
+        cache_dir: Directory containing cached listing HTML files
+        records: Parsed records (listing_id, content_hash, detail)
+    """
+    if not records:
+        return
+    try:
+        with open(cache_dir / 'parsed.jsonl', 'ab') as f:
+            for record in records:
+                if orjson is not None:
+                    f.write(orjson.dumps(record) + b'\n')
+                else:
+                    f.write(
+                        json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n'
+                    )
+    except OSError as e:
+        logger.error("Error writing parsed cache: %s", e)
+
+
+# Filter instance local to each pool worker, built once by
+# _filter_pool_init instead of being pickled per task
+_WORKER_FILTER = None
+
+
+def _filter_pool_init(scraper_type: str, filter_config: Dict[str, Any]):
+    """
+    Pool initializer: build this worker's filter from its config.
+
+    Constructing the filter inside the worker keeps anything
+    non-picklable the filter builds (compiled patterns, caches) out of
+    the task payloads - only the plain config dict crosses over, once.
+
+    Args:
+        scraper_type: Scraper type ('auto' or 'reality')
+        filter_config: Filter criteria from the scraper config
+    """
+    global _WORKER_FILTER
+    _WORKER_FILTER = get_filter({'type': scraper_type, 'filters': filter_config})
+
+
+def _parse_cached_listing(args: tuple) -> tuple:
+    """
+    Pool worker: read, decompress and parse one cached listing.
+
+    Module-level so it pickles cleanly across the process pool; only the
+    path tuple goes in and the extracted dict comes out - file contents
+    and parse trees never cross the process boundary.
+
+    Args:
+        args: (listing_id, file path string, base URL for image links)
+
+    Returns:
+        (listing_id, detail dict or None)
+    """
+    listing_id, path, base_url = args
+    try:
+        content = Path(path).read_bytes()
+        if path.endswith('.zst'):
+            content = _ZSTD_DECOMPRESSOR.decompressobj().decompress(content)
+        return listing_id, _parse_detail_bytes(content, base_url)
+    except Exception:
+        return listing_id, None
+
+
+def _parse_and_filter_cached_listing(args: tuple) -> tuple:
+    """
+    Pool worker: parse one cached listing and apply this worker's filter.
+
+    Filtering is regex- and string-heavy, so running it next to the
+    parse keeps both CPU-bound steps on the worker core; the main
+    process only sees the verdict.
+
+    Args:
+        args: (listing_id, file path string, base URL for image links)
+
+    Returns:
+        (listing_id, detail dict or None, matched flag)
+    """
+    listing_id, detail = _parse_cached_listing(args)
+    if not detail:
+        return listing_id, None, False
+    try:
+        matched = _WORKER_FILTER.matches(
+            {'external_id': listing_id, **detail}, detailed=True
+        )
+    except Exception:
+        matched = False
+    return listing_id, detail, matched
+
+
+def parse_cached_listings_parallel(
+    cache_dir: Path,
+    base_url: str,
+    scraper_config: Optional[Dict[str, Any]] = None,
+    parse_stats: Optional[Dict[str, int]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Read, parse and filter every cached listing across CPU cores.
+
+    HTML parsing and filtering are pure CPU after the read, so large
+    caches are split across a multiprocessing Pool where each worker
+    reads, parses and filters its own files. Small batches stay
+    in-process. Without a scraper_config every parsed listing is
+    treated as a match (no filter applied).
+
+    Matches are yielded as the workers produce them, so the caller can
+    overlap downstream work (DB writes) with the remaining parsing.
+
+    Args:
+        cache_dir: Directory containing cached listing HTML files
+        base_url: Base URL for resolving relative image links
+        scraper_config: Scraper config whose filter runs in the workers
+        parse_stats: Receives 'listings_processed' once iteration ends
+
+    Yields:
+        Matched listing dictionaries
+    """
+    # Sorting by inode approximates on-disk layout order, cutting seeks
+    # on rotational media for churned directories; the inode comes free
+    # with the scandir entry. Neutral on SSDs.
+    with os.scandir(cache_dir) as entries:
+        work_items = [
+            (entry.name.split('.')[0], entry.path, base_url)
+            for entry in sorted(
+                (e for e in entries if e.name.endswith(('.html', '.html.zst'))),
+                key=lambda e: e.inode()
+            )
+        ]
+
+    logger.info(f"Found {len(work_items)} cached listings in {cache_dir}")
+    index_metadata = _load_index_metadata(cache_dir)
+
+    if scraper_config is not None:
+        init_args = (
+            scraper_config.get('type'),
+            scraper_config.get('filters', {})
+        )
+    else:
+        init_args = None
+
+    # Listings whose body hash matches a parsed.jsonl record reuse the
+    # stored extraction instead of re-reading and re-parsing the HTML;
+    # only changed or never-parsed files go to the pool
+    parsed_cache = _load_parsed_cache(cache_dir)
+    reused = []
+    to_parse = []
+    for item in work_items:
+        listing_id = item[0]
+        content_hash = (index_metadata.get(listing_id) or {}).get('content_hash')
+        cached_record = parsed_cache.get(listing_id)
+        if (
+            content_hash
+            and cached_record
+            and cached_record['content_hash'] == content_hash
+        ):
+            reused.append((listing_id, cached_record['detail']))
+        else:
+            to_parse.append(item)
+    if reused:
+        logger.info(f"Reusing {len(reused)} parsed listings from cache")
+
+    parsed_count = 0
+    new_records: List[Dict[str, Any]] = []
+
+    def build_match(result) -> Optional[Dict[str, Any]]:
+        """Turn one worker result into a matched listing (or None)."""
+        nonlocal parsed_count
+        listing_id, detail = result[0], result[1]
+        matched = result[2] if len(result) > 2 else True
+        if not detail:
+            logger.warning("Could not parse listing %s", listing_id)
+            return None
+        parsed_count += 1
+        if not matched:
+            return None
+        metadata = index_metadata.get(listing_id)
+        if metadata is None:
+            # Legacy per-listing sidecar from older runs
             metadata = {}
+            meta_file = cache_dir / f"{listing_id}.meta.json"
             if meta_file.exists():
-                with open(meta_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                raw = meta_file.read_bytes()
+                metadata = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        listing = {
+            'external_id': listing_id,
+            'url': metadata.get('url', ''),
+        }
+        listing.update(detail)
+        return listing
 
-            listings.append((listing_id, soup, metadata))
+    def record_parsed(result) -> None:
+        """Queue a fresh extraction for parsed.jsonl, keyed by body hash."""
+        content_hash = (index_metadata.get(result[0]) or {}).get('content_hash')
+        if result[1] and content_hash:
+            new_records.append({
+                'version': _PARSED_CACHE_VERSION,
+                'listing_id': result[0],
+                'content_hash': content_hash,
+                'detail': result[1],
+            })
 
-        except Exception as e:
-            logger.error(f"Error reading {html_file}: {e}")
+    try:
+        if len(to_parse) >= _POOL_MIN_FILES:
+            workers = min(os.cpu_count() or 1, 8)
+            with multiprocessing.Pool(
+                workers,
+                initializer=_filter_pool_init if init_args else None,
+                initargs=init_args or ()
+            ) as pool:
+                worker = (
+                    _parse_and_filter_cached_listing if init_args
+                    else _parse_cached_listing
+                )
+                for result in pool.imap_unordered(worker, to_parse, chunksize=8):
+                    record_parsed(result)
+                    listing = build_match(result)
+                    if listing is not None:
+                        yield listing
+        else:
+            if init_args:
+                _filter_pool_init(*init_args)
+            worker = (
+                _parse_and_filter_cached_listing if init_args
+                else _parse_cached_listing
+            )
+            for item in to_parse:
+                result = worker(item)
+                record_parsed(result)
+                listing = build_match(result)
+                if listing is not None:
+                    yield listing
+
+        # Reused extractions still need this run's filter verdict
+        if init_args:
+            _filter_pool_init(*init_args)
+        for listing_id, detail in reused:
+            if init_args:
+                try:
+                    matched = _WORKER_FILTER.matches(
+                        {'external_id': listing_id, **detail}, detailed=True
+                    )
+                except Exception:
+                    matched = False
+            else:
+                matched = True
+            listing = build_match((listing_id, detail, matched))
+            if listing is not None:
+                yield listing
+    finally:
+        _append_parsed_cache(cache_dir, new_records)
+        if parse_stats is not None:
+            parse_stats['listings_processed'] = parsed_count
+
+
+def read_cached_listings(cache_dir: Path) -> Iterator[tuple]:
+    """
+    Read cached individual listing HTML files from a directory.
+
+    Listings are yielded one at a time so only a single parsed tree is
+    live at once; materializing every tree up front costs hundreds of
+    KB each across the whole directory.
+
+    Args:
+        cache_dir: Directory containing cached listing HTML files
+
+    Yields:
+        Tuples of (listing_id, lxml tree, metadata)
+    """
+    if not cache_dir.exists():
+        logger.warning(f"Cache directory does not exist: {cache_dir}")
+        return
+
+    # os.scandir hands back names without a stat per entry, unlike glob
+    # which materializes and re-stats a Path per file; sorting by inode
+    # approximates on-disk layout order, cutting seeks on rotational
+    # media for churned directories. Neutral on SSDs.
+    with os.scandir(cache_dir) as entries:
+        html_files = [
+            Path(entry.path)
+            for entry in sorted(
+                (e for e in entries if e.name.endswith(('.html', '.html.zst'))),
+                key=lambda e: e.inode()
+            )
+        ]
+
+    logger.info(f"Found {len(html_files)} cached listings in {cache_dir}")
+
+    # Metadata lives in the category's append-only index.jsonl;
+    # per-listing .meta.json sidecars from older runs still work
+    index_metadata = _load_index_metadata(cache_dir)
+
+    # Prime the page cache a window ahead so the kernel reads the next
+    # files while the current one is being parsed
+    for html_file in html_files[:_PREFETCH_WINDOW]:
+        _advise_willneed(os.fspath(html_file))
 
-    return listings
+    for position, html_file in enumerate(html_files):
+        if position + _PREFETCH_WINDOW < len(html_files):
+            _advise_willneed(os.fspath(html_files[position + _PREFETCH_WINDOW]))
+        try:
+            listing_id = html_file.name.split('.')[0]
+
+            # Read HTML (decompressing .zst entries; decompressobj
+            # handles streamed frames with no content-size header)
+            content = html_file.read_bytes()
+            if html_file.suffix == '.zst':
+                content = _ZSTD_DECOMPRESSOR.decompressobj().decompress(content)
+            # Raw lxml tree - no BS4 wrapper layer on top of the C parse
+            tree = lxml_html.fromstring(content)
+
+            # Read metadata: index first, legacy sidecar as fallback
+            metadata = index_metadata.get(listing_id)
+            if metadata is None:
+                metadata = {}
+                meta_file = html_file.parent / f"{listing_id}.meta.json"
+                if meta_file.exists():
+                    raw = meta_file.read_bytes()
+                    metadata = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+            yield listing_id, tree, metadata
+
+        except Exception as e:
+            logger.error("Error reading %s: %s", html_file, e)
 
 
 def parse_listing_from_html(
     listing_id: str,
-    soup: BeautifulSoup,
+    tree,
     metadata: Dict[str, Any],
     scraper: BazosScraper
 ) -> Optional[Dict[str, Any]]:
@@ -142,7 +577,7 @@ def parse_listing_from_html(
 
     Args:
         listing_id: Listing ID
-        soup: BeautifulSoup of listing detail page
+        tree: lxml tree of listing detail page
         metadata: Metadata about the cached file
         scraper: Scraper instance to use for parsing
 
@@ -151,7 +586,7 @@ def parse_listing_from_html(
     """
     try:
         # Use scraper's detail page parsing logic
-        detail_data = scraper._parse_detail_page_from_soup(soup)
+        detail_data = scraper._parse_detail_page_from_tree(tree)
 
         if not detail_data:
             return None
@@ -168,10 +603,52 @@ def parse_listing_from_html(
         return listing
 
     except Exception as e:
-        logger.error(f"Error parsing listing {listing_id}: {e}")
+        logger.error("Error parsing listing %s: %s", listing_id, e)
         return None
 
 
+def _iter_matches_serial(
+    cache_dir: Path,
+    scraper: BazosScraper,
+    listing_filter,
+    parse_stats: Dict[str, int]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Serial fallback: parse cached listings with lxml and yield matches.
+
+    Listings are handed to the filter in batches via matches_batch,
+    one call instead of one per listing.
+
+    Args:
+        cache_dir: Directory containing cached listing HTML files
+        scraper: Scraper instance to use for parsing
+        listing_filter: Filter deciding which listings match
+        parse_stats: Receives 'listings_processed' once iteration ends
+
+    Yields:
+        Matched listing dictionaries
+    """
+    parsed_count = 0
+    batch: List[Dict[str, Any]] = []
+    try:
+        for listing_id, tree, metadata in read_cached_listings(cache_dir):
+            listing = parse_listing_from_html(listing_id, tree, metadata, scraper)
+            if not listing:
+                logger.warning("Could not parse listing %s", listing_id)
+                continue
+            parsed_count += 1
+            batch.append(listing)
+            if len(batch) >= _FILTER_BATCH_SIZE:
+                verdicts = listing_filter.matches_batch(batch, detailed=True)
+                yield from (l for l, ok in zip(batch, verdicts) if ok)
+                batch = []
+        if batch:
+            verdicts = listing_filter.matches_batch(batch, detailed=True)
+            yield from (l for l, ok in zip(batch, verdicts) if ok)
+    finally:
+        parse_stats['listings_processed'] = parsed_count
+
+
 def get_scraper(scraper_config: Dict[str, Any], http_client: HTTPClient):
     """
     Factory function to create appropriate scraper.
@@ -259,49 +736,64 @@ def process_scraper_from_cache(
     }
 
     try:
-        # Read cached listing HTML files
-        cached_listings = read_cached_listings(cache_dir)
-        if not cached_listings:
-            logger.warning(f"No cached listings found for {name}")
-            return stats
-
         # Create scraper and filter
         scraper = get_scraper(scraper_config, http_client)
         listing_filter = get_filter(scraper_config)
 
-        stats['listings_processed'] = len(cached_listings)
-        logger.info(f"Processing {len(cached_listings)} cached listings...")
-
-        # Process each cached listing
-        for listing_id, soup, metadata in cached_listings:
-            try:
-                # Parse listing from cached HTML
-                logger.debug(f"Parsing cached listing {listing_id}")
-                listing = parse_listing_from_html(listing_id, soup, metadata, scraper)
-
-                if not listing:
-                    logger.warning(f"Could not parse listing {listing_id}")
-                    continue
-
-                # Apply filter on parsed data
-                if listing_filter.matches(listing, detailed=True):
-                    # Listing matches! Save to database
-                    stats['matches_found'] += 1
-                    deal, is_new, price_changed = repository.create_or_update_deal(
-                        listing,
-                        category_id
-                    )
-
-                    if is_new:
-                        stats['new_deals_found'] += 1
-                        logger.info(f"✓ NEW: {listing.get('title')} - {listing.get('price')}€ (ID: {listing_id})")
-                    elif price_changed:
-                        stats['price_changes_detected'] += 1
-                        logger.info(f"↓ PRICE CHANGE: {listing.get('title')} - {listing.get('price')}€ (ID: {listing_id})")
+        # Read, parse and filter cached listing HTML files; the pool
+        # path needs the selectolax parser and runs the filter in the
+        # workers, older installs fall back to the serial lxml read
+        # with the filter applied here
+        parse_stats: Dict[str, int] = {}
+        if _SelectolaxParser is not None:
+            matched_iter = parse_cached_listings_parallel(
+                cache_dir, scraper.base_url, scraper_config, parse_stats
+            )
+        else:
+            matched_iter = _iter_matches_serial(
+                cache_dir, scraper, listing_filter, parse_stats
+            )
+
+        # Matches are written to the database in batches (one upsert
+        # round-trip per _DB_BATCH_SIZE deals) on a single writer
+        # thread, so parsing continues while a batch is in flight
+        writer = ThreadPoolExecutor(max_workers=1)
+        write_futures = []
+        batch: List[Dict[str, Any]] = []
+        try:
+            for listing in matched_iter:
+                stats['matches_found'] += 1
+                batch.append(listing)
+                if len(batch) >= _DB_BATCH_SIZE:
+                    write_futures.append(writer.submit(
+                        repository.bulk_upsert_deals, batch, category_id
+                    ))
+                    batch = []
+            if batch:
+                write_futures.append(writer.submit(
+                    repository.bulk_upsert_deals, batch, category_id
+                ))
+
+            for future in write_futures:
+                result = future.result()
+                stats['new_deals_found'] += result['new']
+                stats['price_changes_detected'] += result['price_changed']
+                logger.info(
+                    f"  Saved batch of {result['processed']} matches "
+                    f"({result['new']} new, {result['price_changed']} price changes)"
+                )
+        finally:
+            writer.shutdown(wait=True)
+
+        stats['listings_processed'] = parse_stats.get('listings_processed', 0)
+        if not stats['listings_processed']:
+            logger.warning(f"No cached listings found for {name}")
+            return stats
 
-            except Exception as e:
-                logger.error(f"Error processing listing {listing_id}: {e}")
-                continue
+        logger.info(
+            f"Processed {stats['listings_processed']} cached listings, "
+            f"{stats['matches_found']} matches"
+        )
 
         # Update scraping run
         repository.update_scraping_run(
@@ -367,13 +859,14 @@ def main():
         logger.error(f"Failed to create database tables: {e}")
         sys.exit(1)
 
-    # Process each enabled scraper
-    total_stats = {
-        'listings_processed': 0,
-        'matches_found': 0,
-        'new_deals_found': 0,
-        'price_changes_detected': 0
-    }
+    # Process each enabled scraper; Counter.update sums the per-scraper
+    # stats dicts in one C-level call
+    total_stats = Counter(
+        listings_processed=0,
+        matches_found=0,
+        new_deals_found=0,
+        price_changes_detected=0
+    )
 
     scrapers = config.get('scrapers', [])
     enabled_scrapers = [s for s in scrapers if s.get('enabled', True)]
@@ -382,10 +875,7 @@ def main():
 
     for scraper_config in enabled_scrapers:
         stats = process_scraper_from_cache(scraper_config, http_client, repository)
-
-        # Accumulate stats
-        for key in total_stats:
-            total_stats[key] += stats.get(key, 0)
+        total_stats.update(stats)
 
     # Clean up
     http_client.close()
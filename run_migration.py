@@ -3,7 +3,13 @@
 import os
 import sys
 from dotenv import load_dotenv
-import psycopg2
+
+# Prefer psycopg (v3) when installed; psycopg2 remains the fallback.
+# Only connect/autocommit/cursor are used, which both drivers share.
+try:
+    import psycopg as _pg
+except ImportError:
+    import psycopg2 as _pg
 
 # Load environment variables
 load_dotenv()
@@ -22,7 +28,7 @@ def run_migration():
 
     try:
         # Connect to database
-        conn = psycopg2.connect(conn_string)
+        conn = _pg.connect(conn_string)
         conn.autocommit = True
         cursor = conn.cursor()
 